@@ -1,58 +1,283 @@
-from flask import Flask, render_template, request, jsonify
-from flask_restx import Api, Resource, fields
-from datetime import datetime, timezone
+from flask import Flask, Response, request, jsonify, send_file
+from flask.json.provider import JSONProvider
+from jinja2 import FileSystemBytecodeCache
+from datetime import datetime, timedelta, timezone
 import re
+import functools
+import glob
+import gzip
+import hashlib
+import importlib.util
+import io
+import itertools
+import orjson
 import pytz
-import threading
+import atexit
+import fcntl
 import os
+import sys
+import threading
+import time
+from settings import SETTINGS
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, which serializes straight to bytes"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+def _exec_gunicorn():
+    """Replace this process with gunicorn, configured by gunicorn.conf.py"""
+    # Same PID, so systemd and its HUP reload keep working
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    os.execv(sys.executable, [sys.executable, '-m', 'gunicorn', '--chdir', app_dir,
+                              '--config', os.path.join(app_dir, 'gunicorn.conf.py'),
+                              'app:app'])
+
+# In production `python app.py` hands off to gunicorn here, before the import-time
+# setup below (stats flusher, template cache, specs, warmup) that exec would discard
+# and that gunicorn's workers do for themselves when they import the app
+if __name__ == "__main__" and not SETTINGS.debug and importlib.util.find_spec('gunicorn') is not None:
+    _exec_gunicorn()
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# In production templates are compiled once at startup and rendered directly,
+# skipping the per-request template lookup and mtime checks of render_template.
+# Under FLASK_DEBUG they are looked up per render so template edits show up.
+app.config['TEMPLATES_AUTO_RELOAD'] = SETTINGS.debug
+# In production keep compiled templates on disk (a per-user directory under the
+# system temp dir) so restarted or newly forked workers load bytecode instead of
+# re-parsing the source; entries are keyed on a checksum of the source
+if not SETTINGS.debug:
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+class _ReloadingTemplate:
+    """Debug stand-in for a preloaded template that re-fetches it on every render"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def render(self, *args, **kwargs):
+        return app.jinja_env.get_template(self.name).render(*args, **kwargs)
+
+def _load_template(name):
+    """Preload a template, or defer the lookup to render time under FLASK_DEBUG"""
+    return _ReloadingTemplate(name) if SETTINGS.debug else app.jinja_env.get_template(name)
+
+_TMPL_INDEX = _load_template('index.html')
+_TMPL_RESULT = _load_template('result.html')
+_TMPL_STATS = _load_template('stats.html')
+
+# Conversion counter. Each worker process counts in memory and a background thread
+# persists it to the worker's own conversion_stats.<pid>.txt, so requests never do
+# file I/O and workers never contend on a shared file or lock; the same thread
+# periodically sums the other workers' files for the /stats/ total. Files left by
+# exited workers are folded into the base file when a worker starts.
+STATS_FILE = 'conversion_stats.txt'  # Base total: legacy count plus exited workers
+STATS_FILE_GLOB = 'conversion_stats.*.txt'
+_RE_STATS_PID = re.compile(r'conversion_stats\.(\d+)\.txt')
+STATS_FLUSH_INTERVAL = 5  # Seconds between background flushes of the in-memory count
+STATS_FLUSH_BATCH = 100  # Wake the flusher early after this many conversions
+
+def _read_count(path):
+    """Read a saved conversion count, treating a missing/unreadable file as 0"""
+    try:
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                return int(f.read().strip() or '0')
+    except Exception:
+        pass
+    return 0
+
+def _read_other_counts():
+    """Sum the legacy baseline and every other worker's stats file"""
+    total = _read_count(STATS_FILE)
+    for path in glob.glob(STATS_FILE_GLOB):
+        if path != _stats_file:
+            total += _read_count(path)
+    return total
+
+def _pid_alive(pid):
+    """Whether a process with this pid exists (signal 0 only checks, it sends nothing)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, but belongs to another user
+    return True
+
+def _fold_stale_counts():
+    """Add the stats files of exited workers to STATS_FILE and delete them"""
+    stale = [path for path in glob.glob(STATS_FILE_GLOB)
+             if (match := _RE_STATS_PID.fullmatch(os.path.basename(path)))
+             and not _pid_alive(int(match.group(1)))]
+    if not stale:
+        return
+    try:
+        fd = os.open(STATS_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # Workers starting together may find the same stale files; the lock
+            # makes sure each is counted once (a file already folded reads as 0)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            total = int(os.pread(fd, 64, 0).strip() or b'0')
+            total += sum(_read_count(path) for path in stale)
+            data = str(total).encode('ascii')
+            os.pwrite(fd, data, 0)
+            os.ftruncate(fd, len(data))
+            for path in stale:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+        finally:
+            os.close(fd)  # Also releases the lock
+    except Exception:
+        pass  # Leave the files in place; they are still summed as other workers
 
-# Conversion counter (thread-safe)
-conversion_count = 0
-conversion_lock = threading.Lock()
-STATS_FILE = 'conversion_stats.txt'
+def _reset_worker_counter():
+    """Start this process's counter from its own per-pid stats file"""
+    global conversion_count, _saved_count, _counter, _stats_file, _stats_fd, _other_count, _flush_wakeup
+    _stats_file = f'conversion_stats.{os.getpid()}.txt'
+    # A forked child inherits the parent's descriptor; close it rather than leak
+    # one per fork, and open its own file on first save
+    if globals().get('_stats_fd') is not None:
+        try:
+            os.close(_stats_fd)
+        except OSError:
+            pass
+    _stats_fd = None
+    conversion_count = _saved_count = _read_count(_stats_file)
+    # next() on an itertools.count is atomic under the GIL, so increments need no lock
+    _counter = itertools.count(conversion_count + 1)
+    _fold_stale_counts()
+    _other_count = _read_other_counts()
+    # A fresh Event, as one inherited across fork may hold a lock from the parent
+    _flush_wakeup = threading.Event()
+    # Threads do not survive fork, so every worker starts its own flusher
+    threading.Thread(target=_flush_loop, name='stats-flusher', daemon=True).start()
+
+def _save_conversion_count(count):
+    """Write this worker's conversion count to its stats file"""
+    global _saved_count, _stats_fd
+    try:
+        # Keep the file open and overwrite in place: one pwrite per flush instead
+        # of an open/truncate/write/close cycle
+        if _stats_fd is None:
+            _stats_fd = os.open(_stats_file, os.O_WRONLY | os.O_CREAT, 0o644)
+        data = str(count).encode('ascii')
+        os.pwrite(_stats_fd, data, 0)
+        os.ftruncate(_stats_fd, len(data))
+        _saved_count = count
+    except Exception:
+        pass  # If file write fails, continue with in-memory count
+
+def flush_conversion_count():
+    """Persist any unsaved conversions (run by the flusher and at shutdown)"""
+    if conversion_count != _saved_count:
+        _save_conversion_count(conversion_count)
+
+def _flush_loop():
+    """Background flusher: keeps all stats file I/O off the request thread"""
+    global _other_count
+    while True:
+        _flush_wakeup.wait(STATS_FLUSH_INTERVAL)
+        _flush_wakeup.clear()
+        flush_conversion_count()
+        _other_count = _read_other_counts()
+
+_reset_worker_counter()
+# Pre-forking servers import the app once and fork workers; give each its own file
+os.register_at_fork(after_in_child=_reset_worker_counter)
+atexit.register(flush_conversion_count)
 
 def increment_conversion_count():
-    """Increment and save conversion count"""
+    """Increment conversion count (in memory; persisted by the background flusher)"""
     global conversion_count
-    with conversion_lock:
-        conversion_count += 1
-        # Save to file for persistence
-        try:
-            with open(STATS_FILE, 'w') as f:
-                f.write(str(conversion_count))
-        except Exception:
-            pass  # If file write fails, continue with in-memory count
+    count = conversion_count = next(_counter)
+    if count % STATS_FLUSH_BATCH == 0:
+        _flush_wakeup.set()  # Persist a busy worker's batch without waiting out the interval
 
 def get_conversion_count():
-    """Get current conversion count"""
-    global conversion_count
-    with conversion_lock:
-        # Try to load from file on first access
-        if conversion_count == 0:
-            try:
-                if os.path.exists(STATS_FILE):
-                    with open(STATS_FILE, 'r') as f:
-                        conversion_count = int(f.read().strip() or '0')
-            except Exception:
-                pass
-        return conversion_count
+    """Get total conversion count across all worker processes"""
+    # Other workers' totals are refreshed by the flusher, so this never touches disk
+    return conversion_count + _other_count
+
+# Timezone abbreviation and friendly name mapping
+_TZ_MAP = {
+    # Pacific timezone
+    'pacific': 'America/Los_Angeles',
+    'pt': 'America/Los_Angeles',
+    'pst': 'America/Los_Angeles',
+    'pdt': 'America/Los_Angeles',
+    # Eastern timezone
+    'eastern': 'America/New_York',
+    'et': 'America/New_York',
+    'est': 'America/New_York',
+    'edt': 'America/New_York',
+    # Central timezone
+    'central': 'America/Chicago',
+    'ct': 'America/Chicago',
+    'cst': 'America/Chicago',
+    'cdt': 'America/Chicago',
+    # Mountain timezone
+    'mountain': 'America/Denver',
+    'mt': 'America/Denver',
+    'mst': 'America/Denver',
+    'mdt': 'America/Denver',
+    # Moscow timezone
+    'moscow': 'Europe/Moscow',
+    'msk': 'Europe/Moscow',
+    # London timezone
+    'london': 'Europe/London',
+    'gmt': 'Europe/London',
+    # Paris timezone
+    'paris': 'Europe/Paris',
+    'cet': 'Europe/Paris',
+    # Berlin timezone
+    'berlin': 'Europe/Berlin',
+    # Tokyo timezone
+    'tokyo': 'Asia/Tokyo',
+    'jst': 'Asia/Tokyo',
+    # Shanghai timezone
+    'shanghai': 'Asia/Shanghai',
+    # Dubai timezone
+    'dubai': 'Asia/Dubai',
+    'gst': 'Asia/Dubai',
+    # Mumbai timezone
+    'mumbai': 'Asia/Kolkata',
+    'ist': 'Asia/Kolkata',
+    # Sydney timezone
+    'sydney': 'Australia/Sydney',
+    'aest': 'Australia/Sydney',
+    # Auckland timezone
+    'auckland': 'Pacific/Auckland',
+    'nzst': 'Pacific/Auckland',
+}
 
-# Initialize Flask-RESTX API for Swagger documentation
-api = Api(app, 
-          version='1.0', 
-          title='TimePuff Epoch Converter API',
-          description='API for converting between epoch time and human-readable datetime',
-          prefix='/api',
-          doc=False) # Custom /api/docs/ route handles documentation
+# Lowercased pytz zone name -> canonical name, with the friendly aliases layered on
+# top, so normalization is a single dict lookup instead of exception-driven probing
+# (keys are interned so lookups of interned input can short-circuit on identity)
+_TZ_LOOKUP = {sys.intern(name.lower()): name for name in pytz.all_timezones}
+_TZ_LOOKUP.update((sys.intern(alias), name) for alias, name in _TZ_MAP.items())
 
-# Create namespaces
-api_v1 = api.namespace('v1', description='JSON API endpoints (v1)')
+# Zones that format identically to the plain UTC path
+_UTC_ZONES = frozenset(('UTC', 'Etc/UTC'))
 
-# Add namespaces to API
-api.add_namespace(api_v1)
+@functools.lru_cache(maxsize=128)
+def _get_tz(name):
+    """Return a cached pytz timezone object (avoids rebuilding tzinfo per request)."""
+    return pytz.timezone(name)
 
+@functools.lru_cache(maxsize=256)
 def normalize_timezone(tz_input):
     """
     Converts timezone abbreviations and friendly names to pytz timezone names.
@@ -61,90 +286,76 @@ def normalize_timezone(tz_input):
     if not tz_input:
         return None
     
-    tz_input = tz_input.lower().strip()
+    tz_input = sys.intern(tz_input.lower().strip())
     
-    # Timezone abbreviation and friendly name mapping
-    tz_map = {
-        # Pacific timezone
-        'pacific': 'America/Los_Angeles',
-        'pt': 'America/Los_Angeles',
-        'pst': 'America/Los_Angeles',
-        'pdt': 'America/Los_Angeles',
-        # Eastern timezone
-        'eastern': 'America/New_York',
-        'et': 'America/New_York',
-        'est': 'America/New_York',
-        'edt': 'America/New_York',
-        # Central timezone
-        'central': 'America/Chicago',
-        'ct': 'America/Chicago',
-        'cst': 'America/Chicago',
-        'cdt': 'America/Chicago',
-        # Mountain timezone
-        'mountain': 'America/Denver',
-        'mt': 'America/Denver',
-        'mst': 'America/Denver',
-        'mdt': 'America/Denver',
-        # Moscow timezone
-        'moscow': 'Europe/Moscow',
-        'msk': 'Europe/Moscow',
-        # London timezone
-        'london': 'Europe/London',
-        'gmt': 'Europe/London',
-        # Paris timezone
-        'paris': 'Europe/Paris',
-        'cet': 'Europe/Paris',
-        # Berlin timezone
-        'berlin': 'Europe/Berlin',
-        # Tokyo timezone
-        'tokyo': 'Asia/Tokyo',
-        'jst': 'Asia/Tokyo',
-        # Shanghai timezone
-        'shanghai': 'Asia/Shanghai',
-        # Dubai timezone
-        'dubai': 'Asia/Dubai',
-        'gst': 'Asia/Dubai',
-        # Mumbai timezone
-        'mumbai': 'Asia/Kolkata',
-        'ist': 'Asia/Kolkata',
-        # Sydney timezone
-        'sydney': 'Australia/Sydney',
-        'aest': 'Australia/Sydney',
-        # Auckland timezone
-        'auckland': 'Pacific/Auckland',
-        'nzst': 'Pacific/Auckland',
-    }
-    
-    # Check if it's a mapped abbreviation or friendly name
-    if tz_input in tz_map:
-        return tz_map[tz_input]
-    
-    # If not found in map, try to use it as-is (might be a valid pytz timezone name)
-    # This allows users to still use full names like 'America/Los_Angeles'
-    try:
-        pytz.timezone(tz_input)
-        return tz_input
-    except:
-        # If it's not a valid pytz name either, return None (will default to UTC)
-        return None
+    # Friendly names and abbreviations first, then any pytz zone name in any case
+    # (e.g. 'America/Los_Angeles'); unknown names return None (will default to UTC)
+    return _TZ_LOOKUP.get(tz_input)
+
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+def _format_datetime(dt, tz_abbrev):
+    """Formats as 'Wed 2025-09-10 13:11:00 UTC' without going through strftime."""
+    return (f"{_WEEKDAYS[dt.weekday()]} {dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} {tz_abbrev}")
 
 def epoch_to_human(epoch, target_tz=None):
     """Converts epoch seconds (UTC) to formatted datetime string."""
-    dt = datetime.fromtimestamp(float(epoch), tz=timezone.utc)
+    # Output has one-second resolution, so whole seconds make a safe cache key;
+    # ints (the common case) are already whole seconds and skip the float round-trip.
+    # Fractions go through fromtimestamp itself, which rounds to the microsecond
+    # (0.9999999 -> 1.0), so the key is the second the uncached path would show
+    if type(epoch) is not int:
+        epoch = _dt_to_epoch(datetime.fromtimestamp(float(epoch), tz=timezone.utc))
+    # Key on the canonical zone name so 'pst', 'PST ' and 'pacific' share entries;
+    # unknown zones and UTC aliases all become None, i.e. UTC
+    tz_name = normalize_timezone(target_tz) if target_tz else None
+    if tz_name in _UTC_ZONES:
+        tz_name = None
+    return _epoch_to_human_cached(epoch, tz_name)
+
+@functools.lru_cache(maxsize=4096)
+def _epoch_to_human_cached(epoch_seconds, tz_name):
+    """Formats whole epoch seconds; memoized since the same (epoch, zone) pairs recur."""
+    if tz_name:
+        try:
+            # Convert straight into the target zone, no intermediate UTC datetime
+            dt = datetime.fromtimestamp(epoch_seconds, tz=_get_tz(tz_name))
+            return _format_datetime(dt, dt.tzname())
+        except Exception:
+            pass  # Fall back to UTC if the zone cannot represent this instant
+    # No timezone (or a UTC alias) requested: skip tz lookup and conversion entirely
+    dt = datetime.fromtimestamp(epoch_seconds, tz=timezone.utc)
+    return _format_datetime(dt, 'UTC')
+
+def _format_dt(dt_utc, target_tz=None):
+    """Formats an aware UTC datetime in target_tz, without a round-trip through epoch seconds."""
     if target_tz:
-        # Normalize timezone abbreviation/friendly name to pytz timezone name
         normalized_tz = normalize_timezone(target_tz)
-        if normalized_tz:
+        if normalized_tz and normalized_tz not in _UTC_ZONES:
             try:
-                tz = pytz.timezone(normalized_tz)
-                dt = dt.astimezone(tz)
-                return dt.strftime('%a %Y-%m-%d %H:%M:%S %Z')
+                dt = dt_utc.astimezone(_get_tz(normalized_tz))
+                return _format_datetime(dt, dt.tzname())
             except Exception:
                 pass  # Fall back to UTC if timezone is invalid
-    return dt.strftime('%a %Y-%m-%d %H:%M:%S UTC')
+    return _format_datetime(dt_utc, 'UTC')
 
-def human_to_epoch(human_str, input_tz=None):
-    """Converts various datetime formats to epoch seconds."""
+# Precompiled datetime format patterns (avoids re-parsing on every request)
+_RE_DASHED = re.compile(r'^\d{4}-\d{2}-\d{2}-\d{6}$')
+_RE_SLASH = re.compile(r'^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}$')
+
+def _parse_compact(s):
+    """Parses fixed-width YYYYMMDDHHMM[SS] digits by slicing (much faster than strptime)."""
+    return datetime(int(s[0:4]), int(s[4:6]), int(s[6:8]),
+                    int(s[8:10]), int(s[10:12]), int(s[12:14] or 0))
+
+def _parse_dashed(s):
+    """Parses fixed-width YYYY-MM-DD-HHMMSS by slicing (much faster than strptime)."""
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[13:15]), int(s[15:17]))
+
+def human_to_dt_utc(human_str, input_tz=None):
+    """Parses various datetime formats into an aware UTC datetime."""
     # Helper to localize datetime to timezone then convert to UTC
     def localize_and_convert_to_utc(dt, tz_name):
         if tz_name:
@@ -152,54 +363,85 @@ def human_to_epoch(human_str, input_tz=None):
             normalized_tz = normalize_timezone(tz_name)
             if normalized_tz:
                 try:
-                    tz = pytz.timezone(normalized_tz)
+                    tz = _get_tz(normalized_tz)
                     localized_dt = tz.localize(dt, is_dst=None)
-                    return int(localized_dt.astimezone(timezone.utc).timestamp())
+                    return localized_dt.astimezone(timezone.utc)
                 except Exception:
-                    # Fall back to UTC if timezone is invalid
-                    dt = dt.replace(tzinfo=timezone.utc)
-                    return int(dt.timestamp())
+                    pass  # Fall back to UTC if timezone is invalid
         # Fall back to UTC if no timezone specified or normalization failed
-        dt = dt.replace(tzinfo=timezone.utc)
-        return int(dt.timestamp())
+        return dt.replace(tzinfo=timezone.utc)
+    
+    # Dispatch on length and character class first; the formats are fixed-width,
+    # so the regex engine is only needed to validate the punctuated forms
+    n = len(human_str)
     
     # Handle YYYY-MM-DD-HHMMSS format
-    if re.match(r'^\d{4}-\d{2}-\d{2}-\d{6}$', human_str):
-        dt = datetime.strptime(human_str, '%Y-%m-%d-%H%M%S')
+    if n == 17 and human_str[4] == '-' and _RE_DASHED.match(human_str):
+        dt = _parse_dashed(human_str)
         return localize_and_convert_to_utc(dt, input_tz)
     
     # Handle YYYYMMDDHHMMSS format
-    elif re.match(r'^\d{14}$', human_str):
-        dt = datetime.strptime(human_str, '%Y%m%d%H%M%S')
+    elif n == 14 and human_str.isdigit():
+        dt = _parse_compact(human_str)
         return localize_and_convert_to_utc(dt, input_tz)
     
     # Handle YYYYMMDDHHMM format (no seconds) - default to 00 seconds
-    elif re.match(r'^\d{12}$', human_str):
-        # Parse as YYYYMMDDHHMM and set seconds to 00
-        dt = datetime.strptime(human_str, '%Y%m%d%H%M')
-        dt = dt.replace(second=0)
+    elif n == 12 and human_str.isdigit():
+        dt = _parse_compact(human_str)
         return localize_and_convert_to_utc(dt, input_tz)
     
     # Handle legacy MM/DD/YYYY HH:MM format
-    elif re.match(r'^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}$', human_str):
+    elif '/' in human_str and _RE_SLASH.match(human_str):
         dt = datetime.strptime(human_str, '%m/%d/%Y %H:%M')
         return localize_and_convert_to_utc(dt, input_tz)
     
     else:
         raise ValueError("Invalid datetime format. Supported formats: YYYY-MM-DD-HHMMSS, YYYYMMDDHHMMSS, YYYYMMDDHHMM, MM/DD/YYYY HH:MM")
 
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_SECOND = timedelta(seconds=1)
+
+def _dt_to_epoch(dt_utc):
+    """Whole epoch seconds of an aware datetime."""
+    # Integer timedelta division stays exact and skips timestamp()'s float round-trip
+    return (dt_utc - _UNIX_EPOCH) // _ONE_SECOND
+
+# Epoch seconds representable as a datetime (years 1 through 9999)
+EPOCH_MIN = _dt_to_epoch(datetime.min.replace(tzinfo=timezone.utc))
+EPOCH_MAX = _dt_to_epoch(datetime.max.replace(tzinfo=timezone.utc))
+
+def human_to_epoch(human_str, input_tz=None):
+    """Converts various datetime formats to epoch seconds."""
+    return _dt_to_epoch(human_to_dt_utc(human_str, input_tz))
+
 # SWET (Star Wars Epoch Time) Functions
 # SWET epoch start: May 26, 1977 00:00:00 UTC (day after Star Wars: A New Hope release)
 SWET_EPOCH_START = datetime(1977, 5, 26, 0, 0, 0, tzinfo=timezone.utc)
 SWET_EPOCH_UNIX = int(SWET_EPOCH_START.timestamp())  # 233280000
+SWET_EPOCH_START_TEXT = SWET_EPOCH_START.strftime('%Y-%m-%d %H:%M:%S UTC')
+SWET_DESCRIPTION = 'Star Wars Epoch Time - seconds since the day after Star Wars: A New Hope release'
+
+# Decimal numbers as float() accepts them (minus inf/nan), including single
+# underscores between digits ("1_000"), so malformed epoch/SWET input can be
+# rejected with a match instead of a raised and caught ValueError
+_DIGITS = r'\d(?:_?\d)*'
+_RE_NUMBER = re.compile(rf'^\s*[-+]?(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][-+]?{_DIGITS})?\s*$')
+
+def _parse_number(value):
+    """Parse a numeric string, keeping plain digit strings as exact ints."""
+    return int(value) if value.isdigit() else float(value)
 
 def unix_to_swet(unix_timestamp):
     """Convert Unix timestamp to SWET (Star Wars Epoch Time)."""
-    return int(float(unix_timestamp)) - SWET_EPOCH_UNIX
+    if type(unix_timestamp) is not int:
+        unix_timestamp = int(float(unix_timestamp))
+    return unix_timestamp - SWET_EPOCH_UNIX
 
 def swet_to_unix(swet_timestamp):
     """Convert SWET timestamp to Unix timestamp."""
-    return int(float(swet_timestamp)) + SWET_EPOCH_UNIX
+    if type(swet_timestamp) is not int:
+        swet_timestamp = int(float(swet_timestamp))
+    return swet_timestamp + SWET_EPOCH_UNIX
 
 def swet_to_human(swet_timestamp, target_tz=None):
     """Convert SWET timestamp to human readable datetime string."""
@@ -213,470 +455,1033 @@ def human_to_swet(human_str, input_tz=None):
 
 def get_swet_info():
     """Get current SWET time and related information."""
-    now_unix = int(datetime.now(timezone.utc).timestamp())
+    return _swet_info_at(int(time.time()))
+
+@functools.lru_cache(maxsize=1)
+def _swet_info_at(now_unix):
+    """SWET info for a given second; memoized since it only changes once a second."""
     current_swet = unix_to_swet(now_unix)
     years_since_release = current_swet / (365.25 * 24 * 3600)  # Account for leap years
     
     return {
         'current_swet': current_swet,
         'years_since_release': round(years_since_release, 1),
-        'swet_epoch_start': '1977-05-26 00:00:00 UTC',
-        'description': 'Star Wars Epoch Time - seconds since the day after Star Wars: A New Hope release'
+        'swet_epoch_start': SWET_EPOCH_START_TEXT,
+        'description': SWET_DESCRIPTION
     }
 
-# Define response models for Swagger documentation
-epoch_response = api_v1.model('EpochResponse', {
-    'epoch': fields.Integer(description='Epoch timestamp', example=1757509860),
-    'datetime': fields.String(description='Human readable datetime', example='Wed 2025-09-10 13:11:00'),
-    'input': fields.String(description='Original input', example='1757509860')
-})
+def _get_tz_param():
+    """Return the stripped ?tz= query parameter, or None when absent or blank"""
+    value = request.args.get('tz')
+    return (value.strip() or None) if value else None
 
-datetime_response = api_v1.model('DateTimeResponse', {
-    'epoch': fields.Integer(description='Epoch timestamp', example=1757509860),
-    'datetime': fields.String(description='Human readable datetime', example='Wed 2025-09-10 13:11:00'),
-    'input': fields.String(description='Original input', example='2025-09-10-131100')
-})
-
-error_response = api_v1.model('ErrorResponse', {
-    'message': fields.String(description='Error message', example='Invalid datetime format')
-})
+def _api_error(message, status=400):
+    """JSON error body in the {"message": ...} shape the API has always returned"""
+    return jsonify(message=message), status
 
 # JSON API endpoints
-@api_v1.route('/epoch/<epoch_time>')
-class EpochToDateTime(Resource):
-    @api_v1.doc('epoch_to_datetime', description='Convert epoch time to human readable datetime. Supports timezone query parameter (?tz=pst)')
-    def get(self, epoch_time):
-        """Convert epoch time to human readable datetime"""
-        try:
-            # Convert epoch_time to float to handle both integers and decimals
-            epoch_float = float(epoch_time)
-            
-            # Get timezone parameter from query string
-            timezone_param = request.args.get('tz', '').strip()
-            human_time = epoch_to_human(epoch_float, target_tz=timezone_param if timezone_param else None)
-            swet_time = unix_to_swet(epoch_float)
-            
-            # Return in explicit order: input, epoch, swet, datetime (using OrderedDict to ensure order)
-            from collections import OrderedDict
-            return OrderedDict([
-                ('input', epoch_time),
-                ('epoch', epoch_float),
-                ('swet', swet_time),
-                ('datetime', human_time)
-            ])
-        except ValueError:
-            api.abort(400, message="Invalid epoch time format")
-        except Exception as e:
-            api.abort(400, message=str(e))
-
-@api_v1.route('/swet/<swet_time>')
-class SWETToDateTime(Resource):
-    @api_v1.doc('swet_to_datetime', description='Convert SWET (Star Wars Epoch Time) to human readable datetime. Supports timezone query parameter (?tz=pst)')
-    def get(self, swet_time):
-        """Convert SWET time to human readable datetime"""
-        try:
-            # Convert swet_time to float to handle both integers and decimals
-            swet_float = float(swet_time)
-            
-            # Get timezone parameter from query string
-            timezone_param = request.args.get('tz', '').strip()
-            human_time = swet_to_human(swet_float, target_tz=timezone_param if timezone_param else None)
-            unix_time = swet_to_unix(swet_float)
-            
-            # Return in explicit order: input, swet, unix, datetime (using OrderedDict to ensure order)
-            from collections import OrderedDict
-            return OrderedDict([
-                ('input', swet_time),
-                ('swet', swet_float),
-                ('unix', unix_time),
-                ('datetime', human_time)
-            ])
-        except ValueError:
-            api.abort(400, message="Invalid SWET time format")
-        except Exception as e:
-            api.abort(400, message=str(e))
-
-@api_v1.route('/datetime-to-swet/<string:datetime_str>')
-class DateTimeToSWET(Resource):
-    @api_v1.doc('datetime_to_swet', description='Convert human readable datetime to SWET (Star Wars Epoch Time). Supports timezone query parameter (?tz=pst)')
-    def get(self, datetime_str):
-        """Convert human readable datetime to SWET time"""
-        try:
-            # Get timezone parameter from query string
-            timezone_param = request.args.get('tz', '').strip()
-            swet_time = human_to_swet(datetime_str, input_tz=timezone_param if timezone_param else None)
-            unix_time = swet_to_unix(swet_time)
-            
-            # Return in explicit order: input, swet, unix, datetime (using OrderedDict to ensure order)
-            from collections import OrderedDict
-            return OrderedDict([
-                ('input', datetime_str),
-                ('swet', swet_time),
-                ('unix', unix_time),
-                ('datetime', datetime_str)  # Return original input format to match curl behavior
-            ])
-        except Exception as e:
-            api.abort(400, message=str(e))
-
-@api_v1.route('/swet-info')
-class SWETInfo(Resource):
-    @api_v1.doc('swet_info', description='Get current SWET (Star Wars Epoch Time) information and statistics')
-    def get(self):
-        """Get current SWET information"""
-        try:
-            return get_swet_info()
-        except Exception as e:
-            api.abort(500, message=str(e))
-
-@api_v1.route('/datetime/<string:datetime_str>')
-class DateTimeToEpoch(Resource):
-    @api_v1.doc('datetime_to_epoch', description='Convert human readable datetime to epoch time. Supports timezone query parameter (?tz=pst)')
-    def get(self, datetime_str):
-        """Convert human readable datetime to epoch time"""
-        try:
-            # Get timezone parameter from query string
-            timezone_param = request.args.get('tz', '').strip()
-            epoch_time = human_to_epoch(datetime_str, input_tz=timezone_param if timezone_param else None)
-            swet_time = unix_to_swet(epoch_time)
-            
-            # Return in explicit order: input, epoch, swet, datetime (using OrderedDict to ensure order)
-            from collections import OrderedDict
-            return OrderedDict([
-                ('input', datetime_str),
-                ('epoch', epoch_time),
-                ('swet', swet_time),
-                ('datetime', datetime_str)  # Return original input format to match curl behavior
-            ])
-        except Exception as e:
-            api.abort(400, message=str(e))
+@app.route('/api/v1/epoch/<epoch_time>')
+def api_epoch_to_datetime(epoch_time):
+    """Convert epoch time to human readable datetime"""
+    if not _RE_NUMBER.match(epoch_time):
+        return _api_error("Invalid epoch time format")
+    try:
+        # Convert epoch_time to float to handle both integers and decimals
+        epoch_float = float(epoch_time)
+        
+        # Get timezone parameter from query string
+        timezone_param = _get_tz_param()
+        human_time = epoch_to_human(epoch_float, target_tz=timezone_param)
+        swet_time = unix_to_swet(epoch_float)
+        
+        # Return in explicit order: input, epoch, swet, datetime (dicts keep insertion order)
+        return jsonify({
+            'input': epoch_time,
+            'epoch': epoch_float,
+            'swet': swet_time,
+            'datetime': human_time
+        })
+    except ValueError:
+        return _api_error("Invalid epoch time format")
+    except Exception as e:
+        return _api_error(str(e))
+
+@app.route('/api/v1/swet/<swet_time>')
+def api_swet_to_datetime(swet_time):
+    """Convert SWET time to human readable datetime"""
+    if not _RE_NUMBER.match(swet_time):
+        return _api_error("Invalid SWET time format")
+    try:
+        # Convert swet_time to float to handle both integers and decimals
+        swet_float = float(swet_time)
+        
+        # Get timezone parameter from query string
+        timezone_param = _get_tz_param()
+        human_time = swet_to_human(swet_float, target_tz=timezone_param)
+        unix_time = swet_to_unix(swet_float)
+        
+        # Return in explicit order: input, swet, unix, datetime (dicts keep insertion order)
+        return jsonify({
+            'input': swet_time,
+            'swet': swet_float,
+            'unix': unix_time,
+            'datetime': human_time
+        })
+    except ValueError:
+        return _api_error("Invalid SWET time format")
+    except Exception as e:
+        return _api_error(str(e))
+
+@app.route('/api/v1/datetime-to-swet/<string:datetime_str>')
+def api_datetime_to_swet(datetime_str):
+    """Convert human readable datetime to SWET time"""
+    try:
+        # Get timezone parameter from query string
+        timezone_param = _get_tz_param()
+        swet_time = human_to_swet(datetime_str, input_tz=timezone_param)
+        unix_time = swet_to_unix(swet_time)
+        
+        # Return in explicit order: input, swet, unix, datetime (dicts keep insertion order)
+        return jsonify({
+            'input': datetime_str,
+            'swet': swet_time,
+            'unix': unix_time,
+            'datetime': datetime_str  # Return original input format to match curl behavior
+        })
+    except Exception as e:
+        return _api_error(str(e))
+
+@app.route('/api/v1/swet-info')
+def api_swet_info():
+    """Get current SWET information"""
+    try:
+        return jsonify(get_swet_info())
+    except Exception as e:
+        return _api_error(str(e), 500)
+
+@app.route('/api/v1/datetime/<string:datetime_str>')
+def api_datetime_to_epoch(datetime_str):
+    """Convert human readable datetime to epoch time"""
+    try:
+        # Get timezone parameter from query string
+        timezone_param = _get_tz_param()
+        epoch_time = human_to_epoch(datetime_str, input_tz=timezone_param)
+        swet_time = unix_to_swet(epoch_time)
+        
+        # Return in explicit order: input, epoch, swet, datetime (dicts keep insertion order)
+        return jsonify({
+            'input': datetime_str,
+            'epoch': epoch_time,
+            'swet': swet_time,
+            'datetime': datetime_str  # Return original input format to match curl behavior
+        })
+    except Exception as e:
+        return _api_error(str(e))
 
 # Curl-friendly API endpoints (plain text) - direct routes for proper functionality
+def _plain_text_response(body, status=200):
+    """Wrap a curl response body as pre-encoded text/plain bytes"""
+    data = body.encode('utf-8')
+    response = app.response_class(data, status=status, mimetype='text/plain')
+    response.headers['Content-Length'] = str(len(data))
+    return response
+
 @app.route('/curl/v1/epoch/<epoch_time>')
 def curl_epoch_to_datetime(epoch_time):
     """Convert epoch time to human readable datetime (plain text)"""
+    if not _RE_NUMBER.match(epoch_time):
+        return _plain_text_response("Error: Invalid epoch time format\n\n", 400)
     try:
-        # Convert epoch_time to float to handle both integers and decimals
-        epoch_float = float(epoch_time)
+        # Parse once: digit strings stay ints, anything else (decimals) is a float
+        epoch_num = _parse_number(epoch_time)
         
         # Get timezone parameter from query string
-        timezone_param = request.args.get('tz', '').strip()
-        human_time = epoch_to_human(epoch_float, target_tz=timezone_param if timezone_param else None)
+        timezone_param = _get_tz_param()
+        human_time = epoch_to_human(epoch_num, target_tz=timezone_param)
         
         # For display purposes, if the input was an integer, show it as an integer
         if '.' not in epoch_time:
-            display_epoch = int(epoch_float)
+            display_epoch = int(epoch_num)
         else:
-            display_epoch = epoch_float
+            display_epoch = epoch_num
             
-        swet_time = unix_to_swet(epoch_float)
-        return f"Input:     {epoch_time}\nEpoch:     {display_epoch}\nSWET:      {swet_time}\nDatetime:  {human_time}\n\n"
+        swet_time = unix_to_swet(epoch_num)
+        return _plain_text_response(f"Input:     {epoch_time}\nEpoch:     {display_epoch}\nSWET:      {swet_time}\nDatetime:  {human_time}\n\n")
     except ValueError:
-        return f"Error: Invalid epoch time format\n\n", 400
+        return _plain_text_response("Error: Invalid epoch time format\n\n", 400)
     except Exception as e:
-        return f"Error: {str(e)}\n\n", 400
+        return _plain_text_response(f"Error: {str(e)}\n\n", 400)
 
 @app.route('/curl/v1/datetime/<string:datetime_str>')
 def curl_datetime_to_epoch(datetime_str):
     """Convert human readable datetime to epoch time (plain text)"""
     try:
-        timezone_param = request.args.get('tz', '').strip()
-        epoch_time = human_to_epoch(datetime_str, input_tz=timezone_param if timezone_param else None)
+        timezone_param = _get_tz_param()
+        epoch_time = human_to_epoch(datetime_str, input_tz=timezone_param)
         swet_time = unix_to_swet(epoch_time)
-        return f"Input:     {datetime_str}\nEpoch:     {epoch_time}\nSWET:      {swet_time}\nDatetime:  {datetime_str}\n\n"
+        return _plain_text_response(f"Input:     {datetime_str}\nEpoch:     {epoch_time}\nSWET:      {swet_time}\nDatetime:  {datetime_str}\n\n")
     except Exception as e:
-        return f"Error: {str(e)}\n\n", 400
+        return _plain_text_response(f"Error: {str(e)}\n\n", 400)
 
 @app.route('/curl/v1/swet/<swet_time>')
 def curl_swet_to_datetime(swet_time):
     """Convert SWET time to human readable datetime (plain text)"""
+    if not _RE_NUMBER.match(swet_time):
+        return _plain_text_response("Error: Invalid SWET time format\n\n", 400)
     try:
-        # Convert swet_time to float to handle both integers and decimals
-        swet_float = float(swet_time)
+        # Parse once: digit strings stay ints, anything else (decimals) is a float
+        swet_num = _parse_number(swet_time)
         
         # Get timezone parameter from query string
-        timezone_param = request.args.get('tz', '').strip()
-        human_time = swet_to_human(swet_float, target_tz=timezone_param if timezone_param else None)
-        unix_time = swet_to_unix(swet_float)
+        timezone_param = _get_tz_param()
+        human_time = swet_to_human(swet_num, target_tz=timezone_param)
+        unix_time = swet_to_unix(swet_num)
         
         # For display purposes, if the input was an integer, show it as an integer
         if '.' not in swet_time:
-            display_swet = int(swet_float)
+            display_swet = int(swet_num)
         else:
-            display_swet = swet_float
+            display_swet = swet_num
             
-        return f"Input:     {swet_time}\nSWET:      {display_swet}\nUnix:      {unix_time}\nDatetime:  {human_time}\n\n"
+        return _plain_text_response(f"Input:     {swet_time}\nSWET:      {display_swet}\nUnix:      {unix_time}\nDatetime:  {human_time}\n\n")
     except ValueError:
-        return f"Error: Invalid SWET time format\n\n", 400
+        return _plain_text_response("Error: Invalid SWET time format\n\n", 400)
     except Exception as e:
-        return f"Error: {str(e)}\n\n", 400
+        return _plain_text_response(f"Error: {str(e)}\n\n", 400)
 
 @app.route('/curl/v1/datetime-to-swet/<string:datetime_str>')
 def curl_datetime_to_swet(datetime_str):
     """Convert human readable datetime to SWET time (plain text)"""
     try:
-        timezone_param = request.args.get('tz', '').strip()
-        swet_time = human_to_swet(datetime_str, input_tz=timezone_param if timezone_param else None)
+        timezone_param = _get_tz_param()
+        swet_time = human_to_swet(datetime_str, input_tz=timezone_param)
         unix_time = swet_to_unix(swet_time)
-        return f"Input:     {datetime_str}\nSWET:      {swet_time}\nUnix:      {unix_time}\nDatetime:  {datetime_str}\n\n"
+        return _plain_text_response(f"Input:     {datetime_str}\nSWET:      {swet_time}\nUnix:      {unix_time}\nDatetime:  {datetime_str}\n\n")
     except Exception as e:
-        return f"Error: {str(e)}\n\n", 400
+        return _plain_text_response(f"Error: {str(e)}\n\n", 400)
+
+# Only the first two fields change, so the rest of the report is filled in once
+_CURL_SWET_INFO_TEMPLATE = """SWET (Star Wars Epoch Time) Information:
+
+Current SWET:        {current_swet}
+Years Since Release: {years_since_release} years
+SWET Epoch Start:    %s
+Description:         %s
+
+""" % (SWET_EPOCH_START_TEXT, SWET_DESCRIPTION)
 
 @app.route('/curl/v1/swet-info')
 def curl_swet_info():
     """Get current SWET information (plain text)"""
     try:
-        info = get_swet_info()
-        return f"""SWET (Star Wars Epoch Time) Information:
-
-Current SWET:        {info['current_swet']}
-Years Since Release: {info['years_since_release']} years
-SWET Epoch Start:    {info['swet_epoch_start']}
-Description:         {info['description']}
-
-"""
+        return _plain_text_response(_CURL_SWET_INFO_TEMPLATE.format_map(get_swet_info()))
     except Exception as e:
-        return f"Error: {str(e)}\n\n", 400
+        return _plain_text_response(f"Error: {str(e)}\n\n", 400)
 
 # Custom 404 error handler for curl endpoints
 @app.errorhandler(404)
 def handle_404(e):
     """Handle 404 errors with plain text for curl endpoints, HTML for others"""
     if request.path.startswith('/curl/'):
-        return f"Error: Endpoint not found. Check your URL and try again.\n\n", 404
+        return _plain_text_response("Error: Endpoint not found. Check your URL and try again.\n\n", 404)
     # For non-curl endpoints, use default HTML 404
     return e
 
-@app.route("/api/v1/swagger.json")
-def swagger_json():
-    """Generate Swagger JSON for ReDoc"""
-    # Flask-RESTX generates spec dynamically, return it as JSON
-    # We'll use a simple approach - return the spec URL that Flask-RESTX provides
-    # ReDoc needs OpenAPI 3.0, so we'll construct a basic one
-    import json
-    spec = {
-        "openapi": "3.0.0",
-        "info": {
-            "title": "TimePuff Epoch Converter API",
-            "version": "1.0",
-            "description": "API for converting between epoch time and human-readable datetime"
+STATIC_VERSIONED_MAX_AGE = 31536000  # One year; a content hash in ?v= changes the URL
+
+@functools.lru_cache(maxsize=32)
+def _static_version(filename):
+    """Short content hash of a static file, or None if it does not exist"""
+    try:
+        with open(os.path.join(app.static_folder, filename), 'rb') as f:
+            return hashlib.md5(f.read()).hexdigest()[:12]
+    except OSError:
+        return None
+
+_RE_STATIC_HREF = re.compile(r'href="/static/([^"?]+)"')
+
+def _version_static_links(html):
+    """Add a ?v= content hash to the /static/ links in a prebuilt page"""
+    def add_version(match):
+        version = _static_version(match.group(1))
+        return f'href="/static/{match.group(1)}?v={version}"' if version else match.group(0)
+    return _RE_STATIC_HREF.sub(add_version, html)
+
+@app.url_defaults
+def version_static_urls(endpoint, values):
+    """Fingerprint url_for('static', ...) links so they can be cached as immutable"""
+    if endpoint == 'static' and 'v' not in values:
+        version = _static_version(values.get('filename', ''))
+        if version:
+            values['v'] = version
+
+@app.after_request
+def cache_versioned_static(response):
+    """Let browsers keep static files requested with a ?v= version for a long time"""
+    # Only the current content hash is immutable; any other ?v= value would pin
+    # whatever this response is for a year in shared caches
+    if (request.endpoint == 'static'
+            and request.args.get('v') == _static_version(request.view_args.get('filename', ''))):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_VERSIONED_MAX_AGE
+        response.cache_control.immutable = True
+    return response
+
+# OpenAPI 3.0 spec for ReDoc. It never changes at runtime, so it is built and
+# serialized once at import.
+_SWAGGER_SPEC = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "TimePuff Epoch Converter API",
+        "version": "1.0",
+        "description": "API for converting between epoch time and human-readable datetime"
+    },
+    "servers": [{"url": "/"}],
+    "paths": {
+        "/api/v1/epoch/{epoch_time}": {
+            "get": {
+                "tags": ["JSON API endpoints (v1)"],
+                "summary": "Convert epoch time to human readable datetime",
+                "parameters": [
+                    {
+                        "name": "epoch_time",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "number"},
+                        "description": "Epoch timestamp (supports decimals)"
+                    },
+                    {
+                        "name": "tz",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"type": "string"},
+                        "description": "Target timezone (e.g., 'pst', 'utc', 'europe/london')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "input": {"type": "string", "example": "1757509860"},
+                                        "epoch": {"type": "integer", "example": 1757509860},
+                                        "swet": {"type": "integer", "example": 1524057060},
+                                        "datetime": {"type": "string", "example": "Wed 2025-09-10 13:11:00"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
         },
-        "servers": [{"url": "/"}],
-        "paths": {
-            "/api/v1/epoch/{epoch_time}": {
-                "get": {
-                    "tags": ["JSON API endpoints (v1)"],
-                    "summary": "Convert epoch time to human readable datetime",
-                    "parameters": [
-                        {
-                            "name": "epoch_time",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "number"},
-                            "description": "Epoch timestamp (supports decimals)"
-                        },
-                        {
-                            "name": "tz",
-                            "in": "query",
-                            "required": False,
-                            "schema": {"type": "string"},
-                            "description": "Target timezone (e.g., 'pst', 'utc', 'europe/london')"
+        "/api/v1/datetime/{datetime_str}": {
+            "get": {
+                "tags": ["JSON API endpoints (v1)"],
+                "summary": "Convert human readable datetime to epoch time",
+                "parameters": [
+                    {
+                        "name": "datetime_str",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "string"},
+                        "description": "Datetime string in various formats"
+                    },
+                    {
+                        "name": "tz",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"type": "string"},
+                        "description": "Input timezone (e.g., 'pst', 'utc', 'europe/london')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "input": {"type": "string", "example": "2025-09-10-131100"},
+                                        "epoch": {"type": "integer", "example": 1757509860},
+                                        "swet": {"type": "integer", "example": 1524057060},
+                                        "datetime": {"type": "string", "example": "2025-09-10-131100"}
+                                    }
+                                }
+                            }
                         }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Success",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "input": {"type": "string", "example": "1757509860"},
-                                            "epoch": {"type": "integer", "example": 1757509860},
-                                            "swet": {"type": "integer", "example": 1524057060},
-                                            "datetime": {"type": "string", "example": "Wed 2025-09-10 13:11:00"}
-                                        }
+                    }
+                }
+            }
+        },
+        "/api/v1/swet/{swet_time}": {
+            "get": {
+                "tags": ["SWET API endpoints (v1)"],
+                "summary": "Convert SWET (Star Wars Epoch Time) to human readable datetime",
+                "parameters": [
+                    {
+                        "name": "swet_time",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "number"},
+                        "description": "SWET timestamp (supports decimals)"
+                    },
+                    {
+                        "name": "tz",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"type": "string"},
+                        "description": "Target timezone (e.g., 'pst', 'utc', 'europe/london')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "input": {"type": "string", "example": "1524057060"},
+                                        "swet": {"type": "integer", "example": 1524057060},
+                                        "unix": {"type": "integer", "example": 1757509860},
+                                        "datetime": {"type": "string", "example": "Wed 2025-09-10 13:11:00"}
                                     }
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/api/v1/datetime/{datetime_str}": {
-                "get": {
-                    "tags": ["JSON API endpoints (v1)"],
-                    "summary": "Convert human readable datetime to epoch time",
-                    "parameters": [
-                        {
-                            "name": "datetime_str",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string"},
-                            "description": "Datetime string in various formats"
-                        },
-                        {
-                            "name": "tz",
-                            "in": "query",
-                            "required": False,
-                            "schema": {"type": "string"},
-                            "description": "Input timezone (e.g., 'pst', 'utc', 'europe/london')"
+            }
+        },
+        "/api/v1/datetime-to-swet/{datetime_str}": {
+            "get": {
+                "tags": ["SWET API endpoints (v1)"],
+                "summary": "Convert human readable datetime to SWET (Star Wars Epoch Time)",
+                "parameters": [
+                    {
+                        "name": "datetime_str",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "string"},
+                        "description": "Datetime string in various formats"
+                    },
+                    {
+                        "name": "tz",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"type": "string"},
+                        "description": "Input timezone (e.g., 'pst', 'utc', 'europe/london')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "input": {"type": "string", "example": "2025-09-10-131100"},
+                                        "swet": {"type": "integer", "example": 1524057060},
+                                        "unix": {"type": "integer", "example": 1757509860},
+                                        "datetime": {"type": "string", "example": "2025-09-10-131100"}
+                                    }
+                                }
+                            }
                         }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Success",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "input": {"type": "string", "example": "2025-09-10-131100"},
-                                            "epoch": {"type": "integer", "example": 1757509860},
-                                            "swet": {"type": "integer", "example": 1524057060},
-                                            "datetime": {"type": "string", "example": "2025-09-10-131100"}
-                                        }
+                    }
+                }
+            }
+        },
+        "/api/v1/swet-info": {
+            "get": {
+                "tags": ["SWET API endpoints (v1)"],
+                "summary": "Get current SWET (Star Wars Epoch Time) information",
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "current_swet": {"type": "integer", "example": 1535098909},
+                                        "years_since_release": {"type": "number", "example": 48.6},
+                                        "swet_epoch_start": {"type": "string", "example": "1977-05-26 00:00:00 UTC"},
+                                        "description": {"type": "string", "example": "Star Wars Epoch Time - seconds since the day after Star Wars: A New Hope release"}
                                     }
                                 }
                             }
                         }
                     }
                 }
+            }
+        }
+    }
+}
+_SWAGGER_JSON_BYTES = orjson.dumps(_SWAGGER_SPEC)
+_SWAGGER_ETAG = hashlib.md5(_SWAGGER_JSON_BYTES).hexdigest()
+
+# Prebuilt payloads only change on restart, so startup time is their Last-Modified
+_STARTUP_TIME = time.time()
+
+GZIP_MIN_SIZE = 512  # Below this the gzip header and CPU cost outweigh the savings
+
+@functools.lru_cache(maxsize=16)
+def _gzipped(body):
+    """Compress a prebuilt payload once, at the highest level since it is reused"""
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+def _static_payload_response(body, mimetype, etag, max_age=3600):
+    """Serve a prebuilt payload like a static file: ETag, Last-Modified, 304s and Range"""
+    compress = len(body) >= GZIP_MIN_SIZE and request.accept_encodings['gzip'] > 0
+    if compress:
+        # Each encoding is a distinct representation, so it needs its own ETag
+        body, etag = _gzipped(body), etag + '-gzip'
+    response = send_file(io.BytesIO(body), mimetype=mimetype, etag=etag,
+                         last_modified=_STARTUP_TIME, max_age=max_age, conditional=True)
+    if compress:
+        response.content_encoding = 'gzip'
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    return response
+
+@app.route("/api/v1/swagger.json")
+def swagger_json():
+    """Serve the OpenAPI JSON for ReDoc"""
+    return _static_payload_response(_SWAGGER_JSON_BYTES, 'application/json', _SWAGGER_ETAG)
+
+# Swagger 2.0 description of the JSON API at /api/swagger.json (the document
+# Flask-RESTX used to generate), also built and serialized once at import
+_API_V1_OPERATIONS = (
+    # (path, path parameter, operationId, summary, description)
+    ('/v1/epoch/{epoch_time}', 'epoch_time', 'epoch_to_datetime',
+     'Convert epoch time to human readable datetime',
+     'Convert epoch time to human readable datetime. Supports timezone query parameter (?tz=pst)'),
+    ('/v1/swet/{swet_time}', 'swet_time', 'swet_to_datetime',
+     'Convert SWET time to human readable datetime',
+     'Convert SWET (Star Wars Epoch Time) to human readable datetime. Supports timezone query parameter (?tz=pst)'),
+    ('/v1/datetime-to-swet/{datetime_str}', 'datetime_str', 'datetime_to_swet',
+     'Convert human readable datetime to SWET time',
+     'Convert human readable datetime to SWET (Star Wars Epoch Time). Supports timezone query parameter (?tz=pst)'),
+    ('/v1/swet-info', None, 'swet_info',
+     'Get current SWET information',
+     'Get current SWET (Star Wars Epoch Time) information and statistics'),
+    ('/v1/datetime/{datetime_str}', 'datetime_str', 'datetime_to_epoch',
+     'Convert human readable datetime to epoch time',
+     'Convert human readable datetime to epoch time. Supports timezone query parameter (?tz=pst)'),
+)
+
+# Response models for the operations whose success body matches a definition below
+_API_V1_RESPONSE_MODELS = {
+    'epoch_to_datetime': 'EpochResponse',
+    'datetime_to_epoch': 'DateTimeResponse',
+}
+
+def _swagger2_path(param, operation_id, summary, description):
+    item = {
+        "get": {
+            "responses": {"200": {"description": "Success"}},
+            "summary": summary,
+            "description": description,
+            "operationId": operation_id,
+            "tags": ["v1"]
+        }
+    }
+    responses = item["get"]["responses"]
+    if operation_id in _API_V1_RESPONSE_MODELS:
+        responses["200"]["schema"] = {"$ref": f"#/definitions/{_API_V1_RESPONSE_MODELS[operation_id]}"}
+    if param:
+        item["parameters"] = [{"name": param, "in": "path", "required": True, "type": "string"}]
+        responses["400"] = {"description": "Invalid input",
+                            "schema": {"$ref": "#/definitions/ErrorResponse"}}
+    return item
+
+_API_SWAGGER_SPEC = {
+    "swagger": "2.0",
+    "basePath": "/api",
+    "info": _SWAGGER_SPEC["info"],
+    "produces": ["application/json"],
+    "consumes": ["application/json"],
+    "tags": [{"name": "v1", "description": "JSON API endpoints (v1)"}],
+    "paths": {path: _swagger2_path(*rest) for path, *rest in _API_V1_OPERATIONS},
+    "definitions": {
+        "EpochResponse": {
+            "properties": {
+                "epoch": {"type": "integer", "description": "Epoch timestamp", "example": 1757509860},
+                "datetime": {"type": "string", "description": "Human readable datetime", "example": "Wed 2025-09-10 13:11:00"},
+                "input": {"type": "string", "description": "Original input", "example": "1757509860"}
             },
-            "/api/v1/swet/{swet_time}": {
-                "get": {
-                    "tags": ["SWET API endpoints (v1)"],
-                    "summary": "Convert SWET (Star Wars Epoch Time) to human readable datetime",
-                    "parameters": [
-                        {
-                            "name": "swet_time",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "number"},
-                            "description": "SWET timestamp (supports decimals)"
-                        },
-                        {
-                            "name": "tz",
-                            "in": "query",
-                            "required": False,
-                            "schema": {"type": "string"},
-                            "description": "Target timezone (e.g., 'pst', 'utc', 'europe/london')"
+            "type": "object"
+        },
+        "DateTimeResponse": {
+            "properties": {
+                "epoch": {"type": "integer", "description": "Epoch timestamp", "example": 1757509860},
+                "datetime": {"type": "string", "description": "Human readable datetime", "example": "Wed 2025-09-10 13:11:00"},
+                "input": {"type": "string", "description": "Original input", "example": "2025-09-10-131100"}
+            },
+            "type": "object"
+        },
+        "ErrorResponse": {
+            "properties": {
+                "message": {"type": "string", "description": "Error message", "example": "Invalid datetime format"}
+            },
+            "type": "object"
+        }
+    }
+}
+_API_SWAGGER_JSON_BYTES = orjson.dumps(_API_SWAGGER_SPEC)
+_API_SWAGGER_ETAG = hashlib.md5(_API_SWAGGER_JSON_BYTES).hexdigest()
+
+@app.route("/api/swagger.json")
+def api_swagger_json():
+    """Serve the Swagger 2.0 JSON for the v1 API"""
+    return _static_payload_response(_API_SWAGGER_JSON_BYTES, 'application/json', _API_SWAGGER_ETAG)
+
+def _minify_html(html):
+    """Drop indentation and blank lines from an embedded page"""
+    # Safe for these pages: they have no <pre> blocks or multi-line JS strings
+    return '\n'.join(line.strip() for line in html.splitlines() if line.strip())
+
+# Swagger 2.0 spec for the "Try it out" page, covering both the JSON and the curl
+# endpoints. Served as its own cacheable document so the page HTML stays small.
+_SWAGGER_UI_SPEC = {
+    "swagger": "2.0",
+    "info": {
+        "title": "TimePuff Epoch Converter API",
+        "version": "1.0",
+        "description": "API for converting between epoch time and human-readable datetime"
+    },
+    "basePath": "/",
+    "tags": [
+        {
+            "name": "JSON API endpoints (v1)",
+            "description": "JSON API endpoints (v1)"
+        },
+        {
+            "name": "CURL endpoints (v1)",
+            "description": "CURL endpoints (v1)"
+        }
+    ],
+    "paths": {
+        "/api/v1/epoch/{epoch_time}": {
+            "get": {
+                "tags": [
+                    "JSON API endpoints (v1)"
+                ],
+                "summary": "Convert epoch time to human readable datetime",
+                "description": "Convert epoch time to human readable datetime",
+                "parameters": [
+                    {
+                        "name": "epoch_time",
+                        "in": "path",
+                        "required": True,
+                        "type": "integer",
+                        "description": "Epoch timestamp"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "input": {
+                                    "type": "string",
+                                    "example": "1757509860"
+                                },
+                                "epoch": {
+                                    "type": "number",
+                                    "example": 1757509860
+                                },
+                                "swet": {
+                                    "type": "integer",
+                                    "example": 1524057060
+                                },
+                                "datetime": {
+                                    "type": "string",
+                                    "example": "Wed 2025-09-10 13:11:00 UTC"
+                                }
+                            }
                         }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Success",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "input": {"type": "string", "example": "1524057060"},
-                                            "swet": {"type": "integer", "example": 1524057060},
-                                            "unix": {"type": "integer", "example": 1757509860},
-                                            "datetime": {"type": "string", "example": "Wed 2025-09-10 13:11:00"}
-                                        }
-                                    }
+                    }
+                }
+            }
+        },
+        "/api/v1/datetime/{datetime_str}": {
+            "get": {
+                "tags": [
+                    "JSON API endpoints (v1)"
+                ],
+                "summary": "Convert human readable datetime to epoch time",
+                "description": "Convert human readable datetime to epoch time",
+                "parameters": [
+                    {
+                        "name": "datetime_str",
+                        "in": "path",
+                        "required": True,
+                        "type": "string",
+                        "description": "Datetime string in various formats"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "input": {
+                                    "type": "string",
+                                    "example": "2025-09-10-131100"
+                                },
+                                "epoch": {
+                                    "type": "integer",
+                                    "example": 1757509860
+                                },
+                                "swet": {
+                                    "type": "integer",
+                                    "example": 1524057060
+                                },
+                                "datetime": {
+                                    "type": "string",
+                                    "example": "2025-09-10-131100"
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/api/v1/datetime-to-swet/{datetime_str}": {
-                "get": {
-                    "tags": ["SWET API endpoints (v1)"],
-                    "summary": "Convert human readable datetime to SWET (Star Wars Epoch Time)",
-                    "parameters": [
-                        {
-                            "name": "datetime_str",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string"},
-                            "description": "Datetime string in various formats"
-                        },
-                        {
-                            "name": "tz",
-                            "in": "query",
-                            "required": False,
-                            "schema": {"type": "string"},
-                            "description": "Input timezone (e.g., 'pst', 'utc', 'europe/london')"
+            }
+        },
+        "/api/v1/swet/{swet_time}": {
+            "get": {
+                "tags": [
+                    "JSON API endpoints (v1)"
+                ],
+                "summary": "Convert SWET time to human readable datetime",
+                "description": "Convert SWET (Star Wars Epoch Time) to human readable datetime. Supports decimal SWET times and optional timezone parameter.",
+                "parameters": [
+                    {
+                        "name": "swet_time",
+                        "in": "path",
+                        "required": True,
+                        "type": "number",
+                        "description": "SWET timestamp (supports decimals)"
+                    },
+                    {
+                        "name": "tz",
+                        "in": "query",
+                        "required": False,
+                        "type": "string",
+                        "description": "Target timezone (e.g., 'pst', 'utc', 'europe/london')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "input": {
+                                    "type": "string",
+                                    "example": "1524057060"
+                                },
+                                "swet": {
+                                    "type": "number",
+                                    "example": 1524057060
+                                },
+                                "unix": {
+                                    "type": "integer",
+                                    "example": 1757509860
+                                },
+                                "datetime": {
+                                    "type": "string",
+                                    "example": "Wed 2025-09-10 13:11:00 UTC"
+                                }
+                            }
                         }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Success",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "input": {"type": "string", "example": "2025-09-10-131100"},
-                                            "swet": {"type": "integer", "example": 1524057060},
-                                            "unix": {"type": "integer", "example": 1757509860},
-                                            "datetime": {"type": "string", "example": "2025-09-10-131100"}
-                                        }
-                                    }
+                    }
+                }
+            }
+        },
+        "/api/v1/datetime-to-swet/{datetime_str}": {
+            "get": {
+                "tags": [
+                    "JSON API endpoints (v1)"
+                ],
+                "summary": "Convert human readable datetime to SWET time",
+                "description": "Convert human readable datetime to SWET (Star Wars Epoch Time). Supports optional timezone parameter.",
+                "parameters": [
+                    {
+                        "name": "datetime_str",
+                        "in": "path",
+                        "required": True,
+                        "type": "string",
+                        "description": "Datetime string in various formats"
+                    },
+                    {
+                        "name": "tz",
+                        "in": "query",
+                        "required": False,
+                        "type": "string",
+                        "description": "Input timezone (e.g., 'pst', 'utc', 'europe/london')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "input": {
+                                    "type": "string",
+                                    "example": "2025-09-10-131100"
+                                },
+                                "swet": {
+                                    "type": "integer",
+                                    "example": 1524057060
+                                },
+                                "unix": {
+                                    "type": "integer",
+                                    "example": 1757509860
+                                },
+                                "datetime": {
+                                    "type": "string",
+                                    "example": "2025-09-10-131100"
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/api/v1/swet-info": {
-                "get": {
-                    "tags": ["SWET API endpoints (v1)"],
-                    "summary": "Get current SWET (Star Wars Epoch Time) information",
-                    "responses": {
-                        "200": {
-                            "description": "Success",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "current_swet": {"type": "integer", "example": 1535098909},
-                                            "years_since_release": {"type": "number", "example": 48.6},
-                                            "swet_epoch_start": {"type": "string", "example": "1977-05-26 00:00:00 UTC"},
-                                            "description": {"type": "string", "example": "Star Wars Epoch Time - seconds since the day after Star Wars: A New Hope release"}
-                                        }
-                                    }
+            }
+        },
+        "/api/v1/swet-info": {
+            "get": {
+                "tags": [
+                    "JSON API endpoints (v1)"
+                ],
+                "summary": "Get current SWET information",
+                "description": "Get current SWET (Star Wars Epoch Time) information and statistics.",
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "current_swet": {
+                                    "type": "integer",
+                                    "example": 1535098909
+                                },
+                                "years_since_release": {
+                                    "type": "number",
+                                    "example": 48.6
+                                },
+                                "swet_epoch_start": {
+                                    "type": "string",
+                                    "example": "1977-05-26 00:00:00 UTC"
+                                },
+                                "description": {
+                                    "type": "string",
+                                    "example": "Star Wars Epoch Time - seconds since the day after Star Wars: A New Hope release"
                                 }
                             }
                         }
                     }
                 }
             }
+        },
+        "/curl/v1/epoch/{epoch_time}": {
+            "get": {
+                "tags": [
+                    "curl/v1"
+                ],
+                "summary": "Convert epoch time to human readable datetime (plain text)",
+                "description": "Convert epoch time to human readable datetime (plain text). Supports decimal epoch times and optional timezone parameter.",
+                "parameters": [
+                    {
+                        "name": "epoch_time",
+                        "in": "path",
+                        "required": True,
+                        "type": "number",
+                        "description": "Epoch timestamp (supports decimals)"
+                    },
+                    {
+                        "name": "tz",
+                        "in": "query",
+                        "required": False,
+                        "type": "string",
+                        "description": "Target timezone (e.g., 'pst', 'utc', 'europe/london')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "schema": {
+                            "type": "string",
+                            "example": "Input:     1757509860\\nEpoch:     1757509860\\nSWET:      1524057060\\nDatetime:  Wed 2025-09-10 13:11:00 UTC\\n\\n"
+                        }
+                    }
+                }
+            }
+        },
+        "/curl/v1/datetime/{datetime_str}": {
+            "get": {
+                "tags": [
+                    "curl/v1"
+                ],
+                "summary": "Convert human readable datetime to epoch time (plain text)",
+                "description": "Convert human readable datetime to epoch time (plain text). Supports optional timezone parameter.",
+                "parameters": [
+                    {
+                        "name": "datetime_str",
+                        "in": "path",
+                        "required": True,
+                        "type": "string",
+                        "description": "Datetime string in various formats"
+                    },
+                    {
+                        "name": "tz",
+                        "in": "query",
+                        "required": False,
+                        "type": "string",
+                        "description": "Input timezone (e.g., 'pst', 'utc', 'europe/london')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "schema": {
+                            "type": "string",
+                            "example": "Input:     2025-09-10-131100\\nEpoch:     1757509860\\nSWET:      1524057060\\nDatetime:  2025-09-10-131100\\n\\n"
+                        }
+                    }
+                }
+            }
+        },
+        "/curl/v1/swet/{swet_time}": {
+            "get": {
+                "tags": [
+                    "curl/v1"
+                ],
+                "summary": "Convert SWET time to human readable datetime (plain text)",
+                "description": "Convert SWET (Star Wars Epoch Time) to human readable datetime (plain text). Supports decimal SWET times and optional timezone parameter.",
+                "parameters": [
+                    {
+                        "name": "swet_time",
+                        "in": "path",
+                        "required": True,
+                        "type": "number",
+                        "description": "SWET timestamp (supports decimals)"
+                    },
+                    {
+                        "name": "tz",
+                        "in": "query",
+                        "required": False,
+                        "type": "string",
+                        "description": "Target timezone (e.g., 'pst', 'utc', 'europe/london')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "schema": {
+                            "type": "string",
+                            "example": "Input:     1524277860\\nSWET:      1524277860\\nUnix:      1757557860\\nDatetime:  Wed 2025-09-10 13:11:00\\n\\n"
+                        }
+                    }
+                }
+            }
+        },
+        "/curl/v1/datetime-to-swet/{datetime_str}": {
+            "get": {
+                "tags": [
+                    "curl/v1"
+                ],
+                "summary": "Convert human readable datetime to SWET time (plain text)",
+                "description": "Convert human readable datetime to SWET (Star Wars Epoch Time) (plain text). Supports optional timezone parameter.",
+                "parameters": [
+                    {
+                        "name": "datetime_str",
+                        "in": "path",
+                        "required": True,
+                        "type": "string",
+                        "description": "Datetime string in various formats"
+                    },
+                    {
+                        "name": "tz",
+                        "in": "query",
+                        "required": False,
+                        "type": "string",
+                        "description": "Input timezone (e.g., 'pst', 'utc', 'europe/london')"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "schema": {
+                            "type": "string",
+                            "example": "Input:     2025-09-10-131100\\nSWET:      1524277860\\nUnix:      1757557860\\nDatetime:  2025-09-10-131100\\n\\n"
+                        }
+                    }
+                }
+            }
+        },
+        "/curl/v1/swet-info": {
+            "get": {
+                "tags": [
+                    "curl/v1"
+                ],
+                "summary": "Get current SWET information (plain text)",
+                "description": "Get current SWET (Star Wars Epoch Time) information and statistics (plain text).",
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "schema": {
+                            "type": "string",
+                            "example": "SWET (Star Wars Epoch Time) Information:\\n\\nCurrent SWET:        1535184278\\nYears Since Release: 48.0 years\\nSWET Epoch Start:    1977-05-26 00:00:00 UTC\\nDescription:         Star Wars Epoch Time - seconds since the day after Star Wars: A New Hope release\\n\\n"
+                        }
+                    }
+                }
+            }
         }
     }
-    return jsonify(spec)
+}
 
-@app.route("/api/docs/")
-def swagger_ui():
-    """Custom Swagger UI with snazzy styling"""
-    return f"""
+_SWAGGER_UI_SPEC_BYTES = orjson.dumps(_SWAGGER_UI_SPEC)
+_SWAGGER_UI_SPEC_ETAG = hashlib.md5(_SWAGGER_UI_SPEC_BYTES).hexdigest()
+
+# The Swagger UI page has no per-request values, so build it once at import
+_SWAGGER_UI_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
         <title>TimePuff API - Try it out</title>
-        <link rel="stylesheet" type="text/css" href="https://unpkg.com/swagger-ui-dist@4.15.5/swagger-ui.css" />
+        <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin />
+        <link rel="dns-prefetch" href="https://cdn.jsdelivr.net" />
+        <link rel="stylesheet" type="text/css" href="https://cdn.jsdelivr.net/npm/swagger-ui-dist@4.15.5/swagger-ui.css" />
         <link rel="stylesheet" type="text/css" href="/static/swagger-ui.css" />
         <link rel="stylesheet" type="text/css" href="/static/main.css" />
         <style>
-            html {{
+            html {
                 box-sizing: border-box;
                 overflow: -moz-scrollbars-vertical;
                 overflow-y: scroll;
-            }}
-            *, *:before, *:after {{
+            }
+            *, *:before, *:after {
                 box-sizing: inherit;
-            }}
-            body {{
+            }
+            body {
                 margin:0;
                 background: radial-gradient(ellipse at top, #1a237e 60%, #000 100%);
                 font-family: 'Orbitron', 'Consolas', 'Monaco', monospace;
                 padding-bottom: 40px;
-            }}
-            .header-container {{
+            }
+            .header-container {
                 background: rgba(22, 26, 70, 0.92);
                 border-radius: 20px;
                 max-width: 1200px;
@@ -684,15 +1489,15 @@ def swagger_ui():
                 padding: 32px;
                 text-align: center;
                 box-shadow: 0 0 28px #4157dc, 0 0 4px #00eaff;
-            }}
-            .swagger-header h1 {{
+            }
+            .swagger-header h1 {
                 margin: 0 0 10px 0;
                 color: #00eaff;
                 letter-spacing: 1px;
                 font-size: 3em;
                 text-shadow: 0 0 10px #6d28d9, 0 0 20px #7c3aed, 0 0 30px #8b5cf6;
-            }}
-            .swagger-header h2.subtitle {{
+            }
+            .swagger-header h2.subtitle {
                 margin: 0 0 20px 0;
                 color: #a78bfa;
                 letter-spacing: 0.5px;
@@ -700,12 +1505,12 @@ def swagger_ui():
                 font-weight: normal;
                 text-shadow: 0 0 5px rgba(167, 139, 250, 0.5);
                 opacity: 0.9;
-            }}
-            #swagger-ui {{
+            }
+            #swagger-ui {
                 max-width: 1200px;
                 margin: 0 auto;
                 padding: 20px;
-            }}
+            }
         </style>
     </head>
     <body>
@@ -723,328 +1528,14 @@ def swagger_ui():
             </div>
         </div>
         <div id="swagger-ui"></div>
-        <script src="https://unpkg.com/swagger-ui-dist@4.15.5/swagger-ui-bundle.js"></script>
-        <script src="https://unpkg.com/swagger-ui-dist@4.15.5/swagger-ui-standalone-preset.js"></script>
+        <script defer src="https://cdn.jsdelivr.net/npm/swagger-ui-dist@4.15.5/swagger-ui-bundle.js"></script>
+        <script defer src="https://cdn.jsdelivr.net/npm/swagger-ui-dist@4.15.5/swagger-ui-standalone-preset.js"></script>
         <script>
-            window.onload = function() {{
-                // Custom Swagger spec that includes both JSON and CURL endpoints
-                const customSpec = {{
-                    "swagger": "2.0",
-                    "info": {{
-                        "title": "TimePuff Epoch Converter API",
-                        "version": "1.0",
-                        "description": "API for converting between epoch time and human-readable datetime"
-                    }},
-                    "basePath": "/",
-                    "tags": [
-                        {{"name": "JSON API endpoints (v1)", "description": "JSON API endpoints (v1)"}},
-                        {{"name": "CURL endpoints (v1)", "description": "CURL endpoints (v1)"}}
-                    ],
-                    "paths": {{
-                        "/api/v1/epoch/{{epoch_time}}": {{
-                            "get": {{
-                                "tags": ["JSON API endpoints (v1)"],
-                                "summary": "Convert epoch time to human readable datetime",
-                                "description": "Convert epoch time to human readable datetime",
-                                "parameters": [
-                                    {{
-                                        "name": "epoch_time",
-                                        "in": "path",
-                                        "required": true,
-                                        "type": "integer",
-                                        "description": "Epoch timestamp"
-                                    }}
-                                ],
-                                "responses": {{
-                                    "200": {{
-                                        "description": "Success",
-                                        "schema": {{
-                                            "type": "object",
-                                            "properties": {{
-                                                "input": {{"type": "string", "example": "1757509860"}},
-                                                "epoch": {{"type": "number", "example": 1757509860}},
-                                                "swet": {{"type": "integer", "example": 1524057060}},
-                                                "datetime": {{"type": "string", "example": "Wed 2025-09-10 13:11:00 UTC"}}
-                                            }}
-                                        }}
-                                    }}
-                                }}
-                            }}
-                        }},
-                        "/api/v1/datetime/{{datetime_str}}": {{
-                            "get": {{
-                                "tags": ["JSON API endpoints (v1)"],
-                                "summary": "Convert human readable datetime to epoch time",
-                                "description": "Convert human readable datetime to epoch time",
-                                "parameters": [
-                                    {{
-                                        "name": "datetime_str",
-                                        "in": "path",
-                                        "required": true,
-                                        "type": "string",
-                                        "description": "Datetime string in various formats"
-                                    }}
-                                ],
-                                "responses": {{
-                                    "200": {{
-                                        "description": "Success",
-                                        "schema": {{
-                                            "type": "object",
-                                            "properties": {{
-                                                "input": {{"type": "string", "example": "2025-09-10-131100"}},
-                                                "epoch": {{"type": "integer", "example": 1757509860}},
-                                                "swet": {{"type": "integer", "example": 1524057060}},
-                                                "datetime": {{"type": "string", "example": "2025-09-10-131100"}}
-                                            }}
-                                        }}
-                                    }}
-                                }}
-                            }}
-                        }},
-                        "/api/v1/swet/{{swet_time}}": {{
-                            "get": {{
-                                "tags": ["JSON API endpoints (v1)"],
-                                "summary": "Convert SWET time to human readable datetime",
-                                "description": "Convert SWET (Star Wars Epoch Time) to human readable datetime. Supports decimal SWET times and optional timezone parameter.",
-                                "parameters": [
-                                    {{
-                                        "name": "swet_time",
-                                        "in": "path",
-                                        "required": true,
-                                        "type": "number",
-                                        "description": "SWET timestamp (supports decimals)"
-                                    }},
-                                    {{
-                                        "name": "tz",
-                                        "in": "query",
-                                        "required": false,
-                                        "type": "string",
-                                        "description": "Target timezone (e.g., 'pst', 'utc', 'europe/london')"
-                                    }}
-                                ],
-                                "responses": {{
-                                    "200": {{
-                                        "description": "Success",
-                                        "schema": {{
-                                            "type": "object",
-                                            "properties": {{
-                                                "input": {{"type": "string", "example": "1524057060"}},
-                                                "swet": {{"type": "number", "example": 1524057060}},
-                                                "unix": {{"type": "integer", "example": 1757509860}},
-                                                "datetime": {{"type": "string", "example": "Wed 2025-09-10 13:11:00 UTC"}}
-                                            }}
-                                        }}
-                                    }}
-                                }}
-                            }}
-                        }},
-                        "/api/v1/datetime-to-swet/{{datetime_str}}": {{
-                            "get": {{
-                                "tags": ["JSON API endpoints (v1)"],
-                                "summary": "Convert human readable datetime to SWET time",
-                                "description": "Convert human readable datetime to SWET (Star Wars Epoch Time). Supports optional timezone parameter.",
-                                "parameters": [
-                                    {{
-                                        "name": "datetime_str",
-                                        "in": "path",
-                                        "required": true,
-                                        "type": "string",
-                                        "description": "Datetime string in various formats"
-                                    }},
-                                    {{
-                                        "name": "tz",
-                                        "in": "query",
-                                        "required": false,
-                                        "type": "string",
-                                        "description": "Input timezone (e.g., 'pst', 'utc', 'europe/london')"
-                                    }}
-                                ],
-                                "responses": {{
-                                    "200": {{
-                                        "description": "Success",
-                                        "schema": {{
-                                            "type": "object",
-                                            "properties": {{
-                                                "input": {{"type": "string", "example": "2025-09-10-131100"}},
-                                                "swet": {{"type": "integer", "example": 1524057060}},
-                                                "unix": {{"type": "integer", "example": 1757509860}},
-                                                "datetime": {{"type": "string", "example": "2025-09-10-131100"}}
-                                            }}
-                                        }}
-                                    }}
-                                }}
-                            }}
-                        }},
-                        "/api/v1/swet-info": {{
-                            "get": {{
-                                "tags": ["JSON API endpoints (v1)"],
-                                "summary": "Get current SWET information",
-                                "description": "Get current SWET (Star Wars Epoch Time) information and statistics.",
-                                "responses": {{
-                                    "200": {{
-                                        "description": "Success",
-                                        "schema": {{
-                                            "type": "object",
-                                            "properties": {{
-                                                "current_swet": {{"type": "integer", "example": 1535098909}},
-                                                "years_since_release": {{"type": "number", "example": 48.6}},
-                                                "swet_epoch_start": {{"type": "string", "example": "1977-05-26 00:00:00 UTC"}},
-                                                "description": {{"type": "string", "example": "Star Wars Epoch Time - seconds since the day after Star Wars: A New Hope release"}}
-                                            }}
-                                        }}
-                                    }}
-                                }}
-                            }}
-                        }},
-                        "/curl/v1/epoch/{{epoch_time}}": {{
-                            "get": {{
-                                "tags": ["curl/v1"],
-                                "summary": "Convert epoch time to human readable datetime (plain text)",
-                                "description": "Convert epoch time to human readable datetime (plain text). Supports decimal epoch times and optional timezone parameter.",
-                                "parameters": [
-                                    {{
-                                        "name": "epoch_time",
-                                        "in": "path",
-                                        "required": true,
-                                        "type": "number",
-                                        "description": "Epoch timestamp (supports decimals)"
-                                    }},
-                                    {{
-                                        "name": "tz",
-                                        "in": "query",
-                                        "required": false,
-                                        "type": "string",
-                                        "description": "Target timezone (e.g., 'pst', 'utc', 'europe/london')"
-                                    }}
-                                ],
-                                "responses": {{
-                                    "200": {{
-                                        "description": "Success",
-                                        "schema": {{
-                                            "type": "string",
-                                            "example": "Input:     1757509860\\nEpoch:     1757509860\\nSWET:      1524057060\\nDatetime:  Wed 2025-09-10 13:11:00 UTC\\n\\n"
-                                        }}
-                                    }}
-                                }}
-                            }}
-                        }},
-                        "/curl/v1/datetime/{{datetime_str}}": {{
-                            "get": {{
-                                "tags": ["curl/v1"],
-                                "summary": "Convert human readable datetime to epoch time (plain text)",
-                                "description": "Convert human readable datetime to epoch time (plain text). Supports optional timezone parameter.",
-                                "parameters": [
-                                    {{
-                                        "name": "datetime_str",
-                                        "in": "path",
-                                        "required": true,
-                                        "type": "string",
-                                        "description": "Datetime string in various formats"
-                                    }},
-                                    {{
-                                        "name": "tz",
-                                        "in": "query",
-                                        "required": false,
-                                        "type": "string",
-                                        "description": "Input timezone (e.g., 'pst', 'utc', 'europe/london')"
-                                    }}
-                                ],
-                                "responses": {{
-                                    "200": {{
-                                        "description": "Success",
-                                        "schema": {{
-                                            "type": "string",
-                                            "example": "Input:     2025-09-10-131100\\nEpoch:     1757509860\\nSWET:      1524057060\\nDatetime:  2025-09-10-131100\\n\\n"
-                                        }}
-                                    }}
-                                }}
-                            }}
-                        }},
-                       "/curl/v1/swet/{{swet_time}}": {{
-                           "get": {{
-                               "tags": ["curl/v1"],
-                               "summary": "Convert SWET time to human readable datetime (plain text)",
-                               "description": "Convert SWET (Star Wars Epoch Time) to human readable datetime (plain text). Supports decimal SWET times and optional timezone parameter.",
-                               "parameters": [
-                                   {{
-                                       "name": "swet_time",
-                                       "in": "path",
-                                       "required": true,
-                                       "type": "number",
-                                       "description": "SWET timestamp (supports decimals)"
-                                   }},
-                                   {{
-                                       "name": "tz",
-                                       "in": "query",
-                                       "required": false,
-                                       "type": "string",
-                                       "description": "Target timezone (e.g., 'pst', 'utc', 'europe/london')"
-                                   }}
-                               ],
-                               "responses": {{
-                                   "200": {{
-                                       "description": "Success",
-                                       "schema": {{
-                                           "type": "string",
-                                           "example": "Input:     1524277860\\nSWET:      1524277860\\nUnix:      1757557860\\nDatetime:  Wed 2025-09-10 13:11:00\\n\\n"
-                                       }}
-                                   }}
-                               }}
-                           }}
-                       }},
-                       "/curl/v1/datetime-to-swet/{{datetime_str}}": {{
-                           "get": {{
-                               "tags": ["curl/v1"],
-                               "summary": "Convert human readable datetime to SWET time (plain text)",
-                               "description": "Convert human readable datetime to SWET (Star Wars Epoch Time) (plain text). Supports optional timezone parameter.",
-                               "parameters": [
-                                   {{
-                                       "name": "datetime_str",
-                                       "in": "path",
-                                       "required": true,
-                                       "type": "string",
-                                       "description": "Datetime string in various formats"
-                                   }},
-                                   {{
-                                       "name": "tz",
-                                       "in": "query",
-                                       "required": false,
-                                       "type": "string",
-                                       "description": "Input timezone (e.g., 'pst', 'utc', 'europe/london')"
-                                   }}
-                               ],
-                               "responses": {{
-                                   "200": {{
-                                       "description": "Success",
-                                       "schema": {{
-                                           "type": "string",
-                                           "example": "Input:     2025-09-10-131100\\nSWET:      1524277860\\nUnix:      1757557860\\nDatetime:  2025-09-10-131100\\n\\n"
-                                       }}
-                                   }}
-                               }}
-                           }}
-                       }},
-                       "/curl/v1/swet-info": {{
-                           "get": {{
-                               "tags": ["curl/v1"],
-                               "summary": "Get current SWET information (plain text)",
-                               "description": "Get current SWET (Star Wars Epoch Time) information and statistics (plain text).",
-                               "responses": {{
-                                   "200": {{
-                                       "description": "Success",
-                                       "schema": {{
-                                           "type": "string",
-                                           "example": "SWET (Star Wars Epoch Time) Information:\\n\\nCurrent SWET:        1535184278\\nYears Since Release: 48.0 years\\nSWET Epoch Start:    1977-05-26 00:00:00 UTC\\nDescription:         Star Wars Epoch Time - seconds since the day after Star Wars: A New Hope release\\n\\n"
-                                       }}
-                                   }}
-                               }}
-                           }}
-                       }}
-                    }}
-                }};
-                
-                const ui = SwaggerUIBundle({{
-                    spec: customSpec,
+            // Deferred scripts have run by DOMContentLoaded; no need to wait for onload
+            document.addEventListener('DOMContentLoaded', function() {
+                const ui = SwaggerUIBundle({
+                    // Custom Swagger spec that includes both JSON and CURL endpoints
+                    url: '/api/docs/swagger.json',
                     dom_id: '#swagger-ui',
                     deepLinking: true,
                     presets: [
@@ -1055,246 +1546,121 @@ def swagger_ui():
                         SwaggerUIBundle.plugins.DownloadUrl
                     ],
                     layout: "StandaloneLayout",
-                    tryItOutEnabled: true,
-                    requestInterceptor: (req) => {{
-                        console.log('API Request:', req);
-                        return req;
-                    }},
-                    responseInterceptor: (res) => {{
-                        console.log('API Response:', res);
-                        return res;
-                    }}
-                }});
-            }};
+                    tryItOutEnabled: true
+                });
+            });
         </script>
     </body>
     </html>
     """
+_SWAGGER_UI_HTML = _version_static_links(_minify_html(_SWAGGER_UI_HTML)).encode('utf-8')
+_SWAGGER_UI_ETAG = hashlib.md5(_SWAGGER_UI_HTML).hexdigest()
+
+@app.route("/api/docs/")
+def swagger_ui():
+    """Custom Swagger UI with snazzy styling"""
+    return _static_payload_response(_SWAGGER_UI_HTML, 'text/html', _SWAGGER_UI_ETAG)
+
+@app.route("/api/docs/swagger.json")
+def swagger_ui_spec():
+    """Serve the Swagger JSON (JSON and curl endpoints) for the Swagger UI page"""
+    return _static_payload_response(_SWAGGER_UI_SPEC_BYTES, 'application/json', _SWAGGER_UI_SPEC_ETAG)
 
 @app.route("/health")
 def health():
     """Health check endpoint for load balancers and monitoring."""
-    return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}, 200
+    return Response(_health_body_at(int(time.time())), mimetype='application/json')
+
+@functools.lru_cache(maxsize=1)
+def _health_body_at(now_unix):
+    """Serialized health body for a given second; probes within the same second share it."""
+    timestamp = datetime.fromtimestamp(now_unix, timezone.utc).isoformat()
+    return orjson.dumps({"status": "healthy", "timestamp": timestamp})
+
+# Fixed messages for errors whose own text is not useful to the user; a
+# ValueError keeps its message, which names the bad format or field
+_RESULT_ERRORS = {
+    OverflowError: "Date out of range",
+    OSError: "Epoch time out of range",
+}
 
-@app.route("/epoch/<int:epoch_time>")
+@functools.lru_cache(maxsize=64)
+def _render_result_error(message):
+    """Result page for an error; it depends only on the message, so renders are memoized."""
+    return _TMPL_RESULT.render(epoch=None, datetime=None, input_value=None,
+                               timezone=None, error=message)
+
+@app.route("/epoch/<int(signed=True):epoch_time>")
 def restful_epoch(epoch_time):
     """RESTful endpoint to convert epoch to datetime and display result page."""
-    timezone_param = request.args.get('tz', '').strip()
-    timezone_display = timezone_param if timezone_param else 'UTC'
+    timezone_param = _get_tz_param()
     
-    try:
-        # Convert epoch to datetime
-        datetime_str = epoch_to_human(epoch_time, target_tz=timezone_param if timezone_param else None)
-        increment_conversion_count()
-        
-        return render_template("result.html",
-                             epoch=epoch_time,
-                             datetime=datetime_str,
-                             input_value=str(epoch_time),
-                             timezone=timezone_display if timezone_param else None,
-                             error=None)
-    except Exception as e:
-        return render_template("result.html",
-                             epoch=None,
-                             datetime=None,
-                             input_value=str(epoch_time),
-                             timezone=None,
-                             error=f"Error: {str(e)}"), 400
+    # Range-check up front; in range, epoch_to_human falls back to UTC rather than raise
+    if not EPOCH_MIN <= epoch_time <= EPOCH_MAX:
+        error = "Epoch time out of range"
+    else:
+        try:
+            # Convert epoch to datetime
+            datetime_str = epoch_to_human(epoch_time, target_tz=timezone_param)
+            increment_conversion_count()
+            
+            return _TMPL_RESULT.render(epoch=epoch_time,
+                                       datetime=datetime_str,
+                                       input_value=epoch_time,
+                                       timezone=timezone_param,
+                                       error=None)
+        except (ValueError, OverflowError, OSError) as e:
+            error = _RESULT_ERRORS.get(type(e)) or str(e)  # OSError: platform time_t limits
+    return _render_result_error(error), 400
 
 @app.route("/datetime/<string:datetime_str>")
 def restful_datetime(datetime_str):
     """RESTful endpoint to convert datetime to epoch and display result page."""
-    timezone_param = request.args.get('tz', '').strip()
-    timezone_display = timezone_param if timezone_param else 'UTC'
+    timezone_param = _get_tz_param()
+    timezone_display = timezone_param or 'UTC'
     
     try:
-        # Handle optional seconds - if 12 digits, append '00' for seconds
-        normalized_datetime = datetime_str
-        
-        # Check if it's a 12-digit YYYYMMDDHHMM format (without seconds)
-        if re.match(r'^\d{12}$', datetime_str):
-            # Add '00' seconds to make it 14 digits
-            normalized_datetime = datetime_str + '00'
-        
-        # Convert datetime to epoch
-        epoch_time = human_to_epoch(normalized_datetime, input_tz=timezone_param if timezone_param else None)
-        
-        # Get formatted datetime for display
-        formatted_datetime = epoch_to_human(epoch_time, target_tz=timezone_param if timezone_param else None)
+        # Parse once, then derive both the epoch and the display string from it
+        # (12-digit YYYYMMDDHHMM input is handled by the parser, seconds default to 00)
+        dt_utc = human_to_dt_utc(datetime_str, input_tz=timezone_param)
+        epoch_time = _dt_to_epoch(dt_utc)
+        formatted_datetime = _format_dt(dt_utc, timezone_param)
         increment_conversion_count()
         
-        return render_template("result.html",
-                             epoch=epoch_time,
-                             datetime=formatted_datetime,
-                             input_value=datetime_str,
-                             timezone=timezone_display,
-                             error=None)
-    except Exception as e:
-        return render_template("result.html",
-                             epoch=None,
-                             datetime=None,
-                             input_value=datetime_str,
-                             timezone=None,
-                             error=f"Error: {str(e)}"), 400
+        return _TMPL_RESULT.render(epoch=epoch_time,
+                                   datetime=formatted_datetime,
+                                   input_value=datetime_str,
+                                   timezone=timezone_display,
+                                   error=None)
+    except (ValueError, OverflowError) as e:
+        # Bad format or calendar values, or a zone shift past year 1/9999
+        return _render_result_error(_RESULT_ERRORS.get(type(e)) or str(e)), 400
+
+@functools.lru_cache(maxsize=1)
+def _render_stats(count):
+    """Render the stats page; only re-rendered when the total has changed"""
+    return _TMPL_STATS.render(conversion_count=count)
 
 @app.route("/stats/")
 def stats():
     """Display conversion statistics"""
-    count = get_conversion_count()
-    return render_template("stats.html", conversion_count=count)
+    return _render_stats(get_conversion_count())
 
-@app.route("/api/redoc/")
-def redoc():
-    """ReDoc API documentation page with matching styling"""
-    return f"""
+# Like the Swagger UI page, the ReDoc page is static and built once at import.
+# ReDoc page styles live in static/redoc.css so browsers cache them across visits;
+# the content hash added to the URL busts that cache whenever the file changes
+
+_REDOC_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
         <title>TimePuff API Documentation</title>
-        <link rel="stylesheet" type="text/css" href="https://unpkg.com/swagger-ui-dist@4.15.5/swagger-ui.css" />
+        <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin />
+        <link rel="dns-prefetch" href="https://cdn.jsdelivr.net" />
+        <link rel="stylesheet" type="text/css" href="https://cdn.jsdelivr.net/npm/swagger-ui-dist@4.15.5/swagger-ui.css" />
         <link rel="stylesheet" type="text/css" href="/static/swagger-ui.css" />
         <link rel="stylesheet" type="text/css" href="/static/main.css" />
-        <style>
-            html {{
-                box-sizing: border-box;
-                overflow: -moz-scrollbars-vertical;
-                overflow-y: scroll;
-            }}
-            *, *:before, *:after {{
-                box-sizing: inherit;
-            }}
-            body {{
-                margin:0;
-                background: radial-gradient(ellipse at top, #1a237e 60%, #000 100%);
-                font-family: 'Orbitron', 'Consolas', 'Monaco', monospace;
-                padding-bottom: 40px;
-            }}
-            .header-container {{
-                background: rgba(22, 26, 70, 0.92);
-                border-radius: 20px;
-                max-width: 1200px;
-                margin: 20px auto;
-                padding: 32px;
-                text-align: center;
-                box-shadow: 0 0 28px #4157dc, 0 0 4px #00eaff;
-            }}
-            .swagger-header h1 {{
-                margin: 0 0 10px 0;
-                color: #00eaff;
-                letter-spacing: 1px;
-                font-size: 3em;
-                text-shadow: 0 0 10px #6d28d9, 0 0 20px #7c3aed, 0 0 30px #8b5cf6;
-            }}
-            .swagger-header h2.subtitle {{
-                margin: 0 0 20px 0;
-                color: #a78bfa;
-                letter-spacing: 0.5px;
-                font-size: 1.1em;
-                font-weight: normal;
-                text-shadow: 0 0 5px rgba(167, 139, 250, 0.5);
-                opacity: 0.9;
-            }}
-            #redoc-container {{
-                max-width: 1200px;
-                margin: 0 auto;
-                padding: 20px;
-                background: rgba(22, 26, 70, 0.95);
-                border-radius: 15px;
-                box-shadow: 0 0 28px #4157dc, 0 0 4px #00eaff;
-                border: 1px solid rgba(65, 87, 220, 0.2);
-            }}
-            
-            /* Additional ReDoc styling overrides */
-            #redoc-container .redoc-wrap {{
-                background: transparent !important;
-            }}
-            
-            #redoc-container .menu-content {{
-                background: rgba(22, 26, 70, 0.9) !important;
-                border-right: 1px solid rgba(65, 87, 220, 0.3) !important;
-            }}
-            
-            #redoc-container .menu-content .menu-items {{
-                color: #a78bfa !important;
-            }}
-            
-            #redoc-container .menu-content .menu-item-title {{
-                color: #00eaff !important;
-                text-shadow: 0 0 5px rgba(0, 234, 255, 0.5) !important;
-            }}
-            
-            #redoc-container .api-content {{
-                background: rgba(22, 26, 70, 0.9) !important;
-            }}
-            
-            #redoc-container .redoc-markdown h1,
-            #redoc-container .redoc-markdown h2,
-            #redoc-container .redoc-markdown h3 {{
-                color: #00eaff !important;
-                text-shadow: 0 0 5px rgba(0, 234, 255, 0.5) !important;
-            }}
-            
-            #redoc-container .redoc-markdown p,
-            #redoc-container .redoc-markdown li {{
-                color: #a78bfa !important;
-            }}
-            
-            #redoc-container .http-verb {{
-                background: linear-gradient(135deg, #00eaff 0%, #4157dc 50%, #8b5cf6 100%) !important;
-                color: #fff !important;
-                border-radius: 6px !important;
-                box-shadow: 0 0 10px rgba(0, 234, 255, 0.3) !important;
-            }}
-            
-            #redoc-container .responses-table {{
-                background: rgba(22, 26, 70, 0.8) !important;
-                border: 1px solid rgba(65, 87, 220, 0.3) !important;
-                border-radius: 8px !important;
-            }}
-            
-            #redoc-container .param-name {{
-                color: #00eaff !important;
-                font-weight: 600 !important;
-            }}
-            
-            #redoc-container .param-type {{
-                color: #a78bfa !important;
-            }}
-            
-            #redoc-container code {{
-                background: rgba(22, 26, 70, 0.8) !important;
-                color: #00eaff !important;
-                border: 1px solid rgba(65, 87, 220, 0.3) !important;
-                border-radius: 4px !important;
-            }}
-            
-            #redoc-container pre {{
-                background: rgba(22, 26, 70, 0.9) !important;
-                border: 1px solid rgba(65, 87, 220, 0.3) !important;
-                border-radius: 8px !important;
-                box-shadow: 0 0 10px rgba(65, 87, 220, 0.2) !important;
-            }}
-            
-            /* Custom scrollbar to match theme */
-            #redoc-container *::-webkit-scrollbar {{
-                width: 8px;
-            }}
-            
-            #redoc-container *::-webkit-scrollbar-track {{
-                background: rgba(22, 26, 70, 0.5);
-                border-radius: 4px;
-            }}
-            
-            #redoc-container *::-webkit-scrollbar-thumb {{
-                background: linear-gradient(135deg, #4157dc, #8b5cf6);
-                border-radius: 4px;
-                box-shadow: 0 0 5px rgba(65, 87, 220, 0.3);
-            }}
-            
-            #redoc-container *::-webkit-scrollbar-thumb:hover {{
-                background: linear-gradient(135deg, #00eaff, #4157dc);
-            }}
-        </style>
+        <link rel="stylesheet" type="text/css" href="/static/redoc.css" />
     </head>
     <body>
         <div class="header-container">
@@ -1313,121 +1679,188 @@ def redoc():
         <div id="redoc-container"></div>
         <script src="https://cdn.jsdelivr.net/npm/redoc@2.1.3/bundles/redoc.standalone.js"></script>
         <script>
-            Redoc.init('/api/v1/swagger.json', {{
-                theme: {{
-                    colors: {{
-                        primary: {{
+            Redoc.init('/api/v1/swagger.json', {
+                theme: {
+                    colors: {
+                        primary: {
                             main: '#00eaff'
-                        }},
-                        text: {{
+                        },
+                        text: {
                             primary: '#00eaff',
                             secondary: '#a78bfa'
-                        }},
-                        gray: {{
+                        },
+                        gray: {
                             50: 'rgba(22, 26, 70, 0.1)',
                             100: 'rgba(22, 26, 70, 0.2)'
-                        }},
-                        border: {{
+                        },
+                        border: {
                             dark: 'rgba(65, 87, 220, 0.3)',
                             light: 'rgba(65, 87, 220, 0.1)'
-                        }},
-                        responses: {{
-                            success: {{
+                        },
+                        responses: {
+                            success: {
                                 color: '#00eaff',
                                 backgroundColor: 'rgba(0, 234, 255, 0.1)'
-                            }},
-                            error: {{
+                            },
+                            error: {
                                 color: '#ff6b9d',
                                 backgroundColor: 'rgba(255, 107, 157, 0.1)'
-                            }}
-                        }}
-                    }},
-                    typography: {{
+                            }
+                        }
+                    },
+                    typography: {
                         fontSize: '14px',
                         lineHeight: '1.6em',
                         fontFamily: 'Orbitron, Consolas, Monaco, monospace',
-                        code: {{
+                        code: {
                             fontSize: '13px',
                             color: '#00eaff',
                             backgroundColor: 'rgba(22, 26, 70, 0.8)',
                             border: '1px solid rgba(65, 87, 220, 0.3)',
                             borderRadius: '4px'
-                        }},
-                        headings: {{
+                        },
+                        headings: {
                             fontFamily: 'Orbitron, Consolas, Monaco, monospace',
                             color: '#00eaff',
                             textShadow: '0 0 5px rgba(0, 234, 255, 0.5)'
-                        }}
-                    }},
-                    sidebar: {{
+                        }
+                    },
+                    sidebar: {
                         backgroundColor: 'rgba(22, 26, 70, 0.95)',
                         textColor: '#a78bfa'
-                    }},
-                    rightPanel: {{
+                    },
+                    rightPanel: {
                         backgroundColor: 'rgba(22, 26, 70, 0.9)'
-                    }}
-                }}
-            }}, document.getElementById('redoc-container'));
+                    }
+                }
+            }, document.getElementById('redoc-container'));
         </script>
     </body>
     </html>
     """
+_REDOC_HTML = _version_static_links(_minify_html(_REDOC_HTML)).encode('utf-8')
+_REDOC_ETAG = hashlib.md5(_REDOC_HTML).hexdigest()
 
-@app.route("/", methods=["GET", "POST"])
-def index():
-    result = None
-    direction = None
-    input_value = ''
-    timezone = ''
-    swet_result = None
-    epoch_result = None
-    datetime_result = None
-    
-    if request.method == "POST":
-        direction = request.form.get("direction")
-        input_value = request.form.get("input_value")
-        timezone = request.form.get("timezone", '')
-        try:
-            if direction == "epoch_to_human":
-                epoch_val = float(input_value)
-                datetime_result = epoch_to_human(epoch_val, target_tz=timezone if timezone else None)
-                swet_result = unix_to_swet(epoch_val)
-                result = f"Epoch: {int(epoch_val) if epoch_val.is_integer() else epoch_val}\nSWET: {swet_result}\nDatetime: {datetime_result}"
-            elif direction == "human_to_epoch":
-                epoch_result = human_to_epoch(input_value, input_tz=timezone if timezone else None)
-                swet_result = unix_to_swet(epoch_result)
-                datetime_result = epoch_to_human(epoch_result, target_tz=timezone if timezone else None)
-                result = f"Epoch: {epoch_result}\nSWET: {swet_result}\nDatetime: {datetime_result}"
-            elif direction == "swet_to_human":
-                swet_val = float(input_value)
-                datetime_result = swet_to_human(swet_val, target_tz=timezone if timezone else None)
-                epoch_result = swet_to_unix(swet_val)
-                result = f"SWET: {int(swet_val) if swet_val.is_integer() else swet_val}\nEpoch: {epoch_result}\nDatetime: {datetime_result}"
-            elif direction == "human_to_swet":
-                swet_result = human_to_swet(input_value, input_tz=timezone if timezone else None)
-                epoch_result = swet_to_unix(swet_result)
-                datetime_result = swet_to_human(swet_result, target_tz=timezone if timezone else None)
-                result = f"SWET: {swet_result}\nEpoch: {epoch_result}\nDatetime: {datetime_result}"
-            elif direction == "epoch_to_swet":
-                epoch_val = float(input_value)
-                swet_result = unix_to_swet(epoch_val)
-                datetime_result = epoch_to_human(epoch_val, target_tz=timezone if timezone else None)
-                result = f"Epoch: {int(epoch_val) if epoch_val.is_integer() else epoch_val}\nSWET: {swet_result}\nDatetime: {datetime_result}"
-            elif direction == "swet_to_epoch":
-                swet_val = float(input_value)
-                epoch_result = swet_to_unix(swet_val)
-                datetime_result = swet_to_human(swet_val, target_tz=timezone if timezone else None)
-                result = f"SWET: {int(swet_val) if swet_val.is_integer() else swet_val}\nEpoch: {epoch_result}\nDatetime: {datetime_result}"
-            
-            if result and not str(result).startswith("Error"):
+@app.route("/api/redoc/")
+def redoc():
+    """ReDoc API documentation page with matching styling"""
+    return _static_payload_response(_REDOC_HTML, 'text/html', _REDOC_ETAG)
+
+def _fmt_number(value):
+    return int(value) if value.is_integer() else value
+
+def _convert_from_epoch(input_value, timezone):
+    epoch_val = float(input_value)
+    swet_result = unix_to_swet(epoch_val)
+    datetime_result = epoch_to_human(epoch_val, target_tz=timezone)
+    return f"Epoch: {_fmt_number(epoch_val)}\nSWET: {swet_result}\nDatetime: {datetime_result}"
+
+def _convert_human_to_epoch(input_value, timezone):
+    # Parse once and derive the epoch and the display string from the same datetime
+    dt_utc = human_to_dt_utc(input_value, input_tz=timezone)
+    epoch_result = _dt_to_epoch(dt_utc)
+    swet_result = unix_to_swet(epoch_result)
+    datetime_result = _format_dt(dt_utc, timezone)
+    return f"Epoch: {epoch_result}\nSWET: {swet_result}\nDatetime: {datetime_result}"
+
+def _convert_from_swet(input_value, timezone):
+    swet_val = float(input_value)
+    datetime_result = swet_to_human(swet_val, target_tz=timezone)
+    epoch_result = swet_to_unix(swet_val)
+    return f"SWET: {_fmt_number(swet_val)}\nEpoch: {epoch_result}\nDatetime: {datetime_result}"
+
+def _convert_human_to_swet(input_value, timezone):
+    dt_utc = human_to_dt_utc(input_value, input_tz=timezone)
+    epoch_result = _dt_to_epoch(dt_utc)
+    swet_result = unix_to_swet(epoch_result)
+    datetime_result = _format_dt(dt_utc, timezone)
+    return f"SWET: {swet_result}\nEpoch: {epoch_result}\nDatetime: {datetime_result}"
+
+# Form direction -> converter; epoch_to_* and swet_to_* render the same summary
+_DIRECTIONS = {
+    "epoch_to_human": _convert_from_epoch,
+    "epoch_to_swet": _convert_from_epoch,
+    "human_to_epoch": _convert_human_to_epoch,
+    "swet_to_human": _convert_from_swet,
+    "swet_to_epoch": _convert_from_swet,
+    "human_to_swet": _convert_human_to_swet,
+}
+
+# Numeric form inputs are checked up front (see _RE_NUMBER) so bad input renders
+# an error without raising; the converters' own exceptions are left for odd values.
+# The pattern accepts what float() accepts, so only the wording of the error for
+# malformed input differs from the bare float() ValueError the form used to show
+# (inf and nan, which never converted, now get this message too)
+_NUMERIC_INPUT_ERRORS = {
+    "epoch_to_human": "Invalid epoch time format",
+    "epoch_to_swet": "Invalid epoch time format",
+    "swet_to_human": "Invalid SWET time format",
+    "swet_to_epoch": "Invalid SWET time format",
+}
+
+@functools.lru_cache(maxsize=1)
+def _index_empty_page():
+    """Render the blank converter form once; it is identical for every GET"""
+    body = _TMPL_INDEX.render(result=None, error=None, direction=None,
+                              input_value='', timezone='').encode('utf-8')
+    return body, hashlib.md5(body).hexdigest()
+
+@app.route("/", methods=["GET"])
+def index_get():
+    # Rendered lazily on the first GET so url_for() has a real request context
+    body, etag = _index_empty_page()
+    return _static_payload_response(body, 'text/html', etag, max_age=60)
+
+@app.route("/", methods=["POST"])
+def index_post():
+    # One flat dict copy, then plain dict lookups instead of MultiDict.get calls
+    form = request.form.to_dict()
+    direction = form.get("direction")
+    input_value = form.get("input_value", '')
+    timezone = form.get("timezone", '')
+    result = error = None
+    convert = _DIRECTIONS.get(direction)
+    if convert is not None:
+        input_error = _NUMERIC_INPUT_ERRORS.get(direction)
+        if input_error and not _RE_NUMBER.match(input_value):
+            error = input_error
+        else:
+            try:
+                result = convert(input_value, timezone or None)
                 increment_conversion_count()
-        except Exception as e:
-            result = f"Error: {e}"
-    return render_template("index.html", result=result, direction=direction, input_value=input_value, timezone=timezone)
+            except Exception as e:
+                error = e
+    return _TMPL_INDEX.render(result=result, error=error, direction=direction,
+                              input_value=input_value, timezone=timezone)
+
+def _warmup():
+    """Pay one-time costs at worker start rather than on the first user request"""
+    # Load the zone files behind the friendly aliases into the tz cache
+    for name in set(_TZ_MAP.values()):
+        _get_tz(name)
+    human_to_epoch('19700101000000', input_tz='pst')
+    epoch_to_human(0, target_tz='pst')
+    # Compress the prebuilt docs payloads now rather than on their first request
+    for body in (_SWAGGER_UI_HTML, _SWAGGER_UI_SPEC_BYTES, _REDOC_HTML,
+                 _SWAGGER_JSON_BYTES, _API_SWAGGER_JSON_BYTES):
+        _gzipped(body)
+    # First renders resolve url_for() and set up Jinja's runtime state
+    with app.test_request_context('/'):
+        _TMPL_INDEX.render(result=None, error=None, direction=None, input_value='', timezone='')
+        _TMPL_RESULT.render(epoch=0, datetime='', input_value='0', timezone=None, error=None)
+        _TMPL_STATS.render(conversion_count=0)
+
+# Flask 3 dropped before_first_request, so warm up at import, i.e. in each worker
+_warmup()
+
+if SETTINGS.debug:
+    @app.before_request
+    def drop_render_caches():
+        """Under FLASK_DEBUG, re-render memoized pages so template edits show up"""
+        for cached_render in (_index_empty_page, _render_stats, _render_result_error):
+            cached_render.cache_clear()
 
 if __name__ == "__main__":
-    import os
-    # Use environment variable for port, default to 33080 for production
-    port = int(os.environ.get('PORT', 33080))
-    debug = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
-    app.run(host="127.0.0.1", port=port, debug=debug)
\ No newline at end of file
+    # Development (or no gunicorn installed): Werkzeug server with reloader/debugger,
+    # one thread per request. Production already handed off to gunicorn above.
+    app.run(host=SETTINGS.host, port=SETTINGS.port, debug=SETTINGS.debug, threaded=True)
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""
+Shared pytest fixtures for the Rantoo test suite
+"""
+import pytest
+from app import app, get_swet_info
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create a test client for the Flask app, shared by every test in a module"""
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def swet_info():
+    """Current SWET info, computed once as the reference for the function and API tests"""
+    return get_swet_info()
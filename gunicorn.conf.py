@@ -0,0 +1,20 @@
+# Gunicorn settings for production. `python app.py` (without FLASK_DEBUG) execs
+# gunicorn with this file; it can also be used directly: gunicorn -c gunicorn.conf.py app:app
+import os
+import sys
+
+# Bind where the development server would, from the same settings the app reads
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from settings import SETTINGS
+
+bind = f"{SETTINGS.host}:{SETTINGS.port}"
+workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+
+# Handlers are short and mostly wait on the socket, so each worker serves
+# several requests at once. gthread needs nothing extra; set
+# GUNICORN_WORKER_CLASS=gevent (after `pip install gevent`) for green threads,
+# which gunicorn monkey-patches itself before loading the app.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))  # gthread only
+worker_connections = 1000  # gevent only
+keepalive = 5
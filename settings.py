@@ -0,0 +1,16 @@
+"""
+Runtime settings shared by the Flask app and gunicorn.conf.py
+"""
+from dataclasses import dataclass
+import os
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Runtime settings, read from the environment once at import"""
+    # Use environment variable for port, default to 33080 for production
+    port: int = int(os.environ.get('PORT', 33080))
+    # Loopback by default; the reverse proxy in front of the app is the public face
+    host: str = os.environ.get('HOST', '127.0.0.1')
+    debug: bool = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
+
+SETTINGS = Settings()
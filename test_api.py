@@ -3,9 +3,45 @@
 Unit tests for the Rantoo Epoch Converter API
 """
 import pytest
-import json
-from datetime import datetime, timezone
-from app import app, human_to_epoch, epoch_to_human, unix_to_swet, swet_to_unix, swet_to_human, human_to_swet, get_swet_info
+import gzip
+import os
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+import app as timepuff_app
+from app import human_to_epoch, epoch_to_human, unix_to_swet, swet_to_unix, swet_to_human, human_to_swet
+
+# Every supported input format, shared by the function, JSON API and curl tests
+DATETIME_FORMAT_CASES = [
+    ('2025-09-10-131100', 1757509860),  # YYYY-MM-DD-HHMMSS
+    ('20250910131100', 1757509860),  # YYYYMMDDHHMMSS
+    ('202509101311', 1757509860),  # YYYYMMDDHHMM, seconds default to 00
+    ('12/25/2023 16:10', 1703520600),  # Legacy MM/DD/YYYY HH:MM
+]
+# The legacy format's slashes cannot appear in a URL path segment
+URL_DATETIME_FORMAT_CASES = [case for case in DATETIME_FORMAT_CASES if '/' not in case[0]]
+
+# Known SWET timestamp; converts to Unix 1757509860 (Wed 2025-09-10 13:11:00 UTC)
+SWET_TIMESTAMP = 1524057060
+
+# /health timestamp: whole seconds, UTC offset, e.g. "2025-09-10T13:11:00+00:00"
+HEALTH_TIMESTAMP_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\+00:00$')
+
+# Numeric epoch/SWET input: what the up-front format check lets through and what it
+# rejects (float() itself would accept inf and nan)
+VALID_NUMBER_INPUTS = ['1e3', ' 123 ', '.5', '1_000']
+INVALID_NUMBER_INPUTS = ['abc', 'inf', 'nan']
+
+# Output format of epoch_to_human, e.g. "Wed 2025-09-10 13:11:00 UTC"
+HUMAN_DATETIME_RE = re.compile(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun) \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \S+$')
+
+
+def assert_all_in(text, needles):
+    """Assert every needle appears in text, reporting all the missing ones at once"""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing from response: {missing}"
 
 
 class TestDateTimeFunctions:
@@ -24,41 +60,35 @@ class TestDateTimeFunctions:
         assert result == "Mon 2023-12-25 16:10:00 UTC"
         
         # Test current time format
-        current_epoch = int(datetime.now(timezone.utc).timestamp())
+        current_epoch = int(time.time())
         result = epoch_to_human(current_epoch)
-        # Should start with day abbreviation and have proper format
-        assert result.startswith(('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'))
-        assert ' ' in result  # Should have space between day and date
-        assert ':' in result  # Should have colons in time
+        # Should be day abbreviation, date, time and zone
+        assert HUMAN_DATETIME_RE.match(result)
+    
+    @pytest.mark.parametrize("epoch,expected", [
+        (0.9999999, "Thu 1970-01-01 00:00:01 UTC"),  # Rounds up at microsecond precision
+        (0.5, "Thu 1970-01-01 00:00:00 UTC"),
+        (-0.5, "Wed 1969-12-31 23:59:59 UTC"),
+        ('1757509860.4', "Wed 2025-09-10 13:11:00 UTC"),
+    ])
+    def test_epoch_to_human_fractional(self, epoch, expected):
+        """Test fractional epochs show the second datetime.fromtimestamp rounds them to"""
+        assert epoch_to_human(epoch) == expected
     
-    def test_human_to_epoch_formats(self):
+    @pytest.mark.parametrize("dt_str,expected", DATETIME_FORMAT_CASES)
+    def test_human_to_epoch_formats(self, dt_str, expected):
         """Test human to epoch conversion with various formats"""
-        # Test YYYY-MM-DD-HHMMSS format
-        result = human_to_epoch('2025-09-10-131100')
-        assert result == 1757509860
-        
-        # Test YYYYMMDDHHMMSS format
-        result = human_to_epoch('20250910131100')
-        assert result == 1757509860
-        
-        # Test YYYYMMDDHHMM format (no seconds)
-        result = human_to_epoch('202509101311')
-        assert result == 1757509860  # Should default seconds to 00
-        
-        # Test legacy MM/DD/YYYY HH:MM format
-        result = human_to_epoch('12/25/2023 16:10')
-        assert result == 1703520600
+        assert human_to_epoch(dt_str) == expected
     
-    def test_human_to_epoch_invalid_formats(self):
+    @pytest.mark.parametrize("bad_input", [
+        'invalid-date',
+        '2025-13-45-250000',  # Invalid month/day/time
+        'not-a-date-at-all',
+    ])
+    def test_human_to_epoch_invalid_formats(self, bad_input):
         """Test human to epoch conversion with invalid formats"""
         with pytest.raises(ValueError):
-            human_to_epoch('invalid-date')
-        
-        with pytest.raises(ValueError):
-            human_to_epoch('2025-13-45-250000')  # Invalid month/day/time
-        
-        with pytest.raises(ValueError):
-            human_to_epoch('not-a-date-at-all')
+            human_to_epoch(bad_input)
     
     def test_epoch_to_human_with_timezone(self):
         """Test epoch to human conversion with timezone"""
@@ -77,6 +107,17 @@ class TestDateTimeFunctions:
         result = epoch_to_human(epoch, 'Asia/Tokyo')
         assert result.endswith('JST') or 'GMT+9' in result
     
+    def test_epoch_to_human_timezone_aliases_share_cache(self):
+        """Test spellings of one zone share a cache entry and unknown zones fall back to UTC"""
+        timepuff_app._epoch_to_human_cached.cache_clear()
+        results = {epoch_to_human(1757509860, tz) for tz in ('pst', 'PST', ' pst', 'pacific')}
+        assert results == {'Wed 2025-09-10 06:11:00 PDT'}
+        assert timepuff_app._epoch_to_human_cached.cache_info().currsize == 1
+        
+        assert epoch_to_human(1757509860, 'nowhere') == "Wed 2025-09-10 13:11:00 UTC"
+        assert epoch_to_human(1757509860, 'utc') == "Wed 2025-09-10 13:11:00 UTC"
+        assert timepuff_app._epoch_to_human_cached.cache_info().currsize == 2
+    
     def test_human_to_epoch_with_timezone(self):
         """Test human to epoch conversion with timezone"""
         # The same datetime in different timezones should produce different epoch values
@@ -123,13 +164,10 @@ class TestSWETFunctions:
         expected_unix = 1524057060 + 233452800  # 1757509860
         assert unix_timestamp == expected_unix
     
-    def test_swet_conversion_is_lossless(self):
+    @pytest.mark.parametrize("original_unix", (0, 233452800, 1703520600, 1757509860, 2**31 - 1))
+    def test_swet_conversion_is_lossless(self, original_unix):
         """Test that SWET conversion is lossless"""
-        original_unix = 1757509860
-        swet = unix_to_swet(original_unix)
-        back_to_unix = swet_to_unix(swet)
-        
-        assert original_unix == back_to_unix
+        assert swet_to_unix(unix_to_swet(original_unix)) == original_unix
     
     def test_swet_to_human(self):
         """Test SWET to human datetime conversion"""
@@ -150,9 +188,9 @@ class TestSWETFunctions:
         expected_swet = 1524057060
         assert swet_timestamp == expected_swet
     
-    def test_get_swet_info(self):
+    def test_get_swet_info(self, swet_info):
         """Test SWET info function"""
-        info = get_swet_info()
+        info = swet_info
         
         # Check that all required keys are present
         required_keys = ['current_swet', 'years_since_release', 'swet_epoch_start', 'description']
@@ -168,89 +206,157 @@ class TestSWETFunctions:
         assert 'Star Wars' in info['description']
 
 
+class TestConversionCounter:
+    """Test the per-worker conversion counter and its stats files"""
+    
+    def test_increment_and_flush(self):
+        """Test an increment is counted in memory and persisted by a flush"""
+        before = timepuff_app.get_conversion_count()
+        timepuff_app.increment_conversion_count()
+        assert timepuff_app.get_conversion_count() == before + 1
+        
+        timepuff_app.flush_conversion_count()
+        saved = timepuff_app._read_count(timepuff_app._stats_file)
+        assert saved == timepuff_app.conversion_count
+    
+    def test_count_sums_across_files(self, tmp_path, monkeypatch):
+        """Test stale worker files are folded into the base file and live ones are summed"""
+        monkeypatch.chdir(tmp_path)
+        exited = subprocess.Popen([sys.executable, '-c', ''])
+        exited.wait()
+        (tmp_path / 'conversion_stats.txt').write_text('10')
+        (tmp_path / f'conversion_stats.{exited.pid}.txt').write_text('5')
+        (tmp_path / f'conversion_stats.{os.getppid()}.txt').write_text('7')
+        
+        timepuff_app._fold_stale_counts()
+        assert (tmp_path / 'conversion_stats.txt').read_text() == '15'
+        assert not (tmp_path / f'conversion_stats.{exited.pid}.txt').exists()
+        assert (tmp_path / f'conversion_stats.{os.getppid()}.txt').exists()
+        
+        monkeypatch.setattr(timepuff_app, '_other_count', timepuff_app._read_other_counts())
+        assert timepuff_app.get_conversion_count() == timepuff_app.conversion_count + 15 + 7
+
+
 class TestAPIEndpoints:
     """Test the Flask API endpoints"""
     
-    @pytest.fixture
-    def client(self):
-        """Create a test client for the Flask app"""
-        app.config['TESTING'] = True
-        with app.test_client() as client:
-            yield client
-    
     def test_api_v1_epoch_to_datetime(self, client):
         """Test /api/v1/epoch/{epoch_time} endpoint"""
         response = client.get('/api/v1/epoch/1757509860')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['epoch'] == 1757509860
         assert data['datetime'] == "Wed 2025-09-10 13:11:00 UTC"
         assert data['input'] == "1757509860"
     
-    def test_api_v1_datetime_to_epoch_formats(self, client):
+    @pytest.mark.parametrize("dt_str,expected", URL_DATETIME_FORMAT_CASES)
+    def test_api_v1_datetime_to_epoch_formats(self, client, dt_str, expected):
         """Test /api/v1/datetime/{datetime_str} endpoint with various formats"""
-        # Test YYYY-MM-DD-HHMMSS format
-        response = client.get('/api/v1/datetime/2025-09-10-131100')
+        response = client.get(f'/api/v1/datetime/{dt_str}')
         assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['epoch'] == 1757509860
-        assert data['datetime'] == "2025-09-10-131100"
-        
-        # Test YYYYMMDDHHMMSS format
-        response = client.get('/api/v1/datetime/20250910131100')
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['epoch'] == 1757509860
-        
-        # Test YYYYMMDDHHMM format (no seconds)
-        response = client.get('/api/v1/datetime/202509101311')
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['epoch'] == 1757509860
+        data = response.get_json()
+        assert data['epoch'] == expected
+        assert data['datetime'] == dt_str
     
     def test_api_v1_invalid_datetime(self, client):
         """Test /api/v1/datetime/{datetime_str} endpoint with invalid input"""
         response = client.get('/api/v1/datetime/invalid-date')
         assert response.status_code == 400
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'message' in data
         assert 'Invalid datetime format' in data['message']
     
+    @pytest.mark.parametrize("url,message", [
+        ('/api/v1/epoch/abc', 'Invalid epoch time format'),
+        ('/api/v1/swet/abc', 'Invalid SWET time format'),
+    ])
+    def test_api_v1_invalid_number(self, client, url, message):
+        """Test the JSON API rejects non-numeric epoch/SWET input with a JSON error"""
+        response = client.get(url)
+        assert response.status_code == 400
+        assert response.content_type == 'application/json'
+        assert response.get_json() == {'message': message}
+    
+    @pytest.mark.parametrize("value", VALID_NUMBER_INPUTS)
+    @pytest.mark.parametrize("kind", ['epoch', 'swet'])
+    def test_number_formats_accepted(self, client, kind, value):
+        """Test the JSON and curl epoch/SWET endpoints accept any finite number format"""
+        assert client.get(f'/api/v1/{kind}/{value}').status_code == 200
+        assert client.get(f'/curl/v1/{kind}/{value}').status_code == 200
+    
+    @pytest.mark.parametrize("value", INVALID_NUMBER_INPUTS)
+    @pytest.mark.parametrize("kind,message", [('epoch', 'Invalid epoch time format'),
+                                              ('swet', 'Invalid SWET time format')])
+    def test_number_formats_rejected(self, client, kind, message, value):
+        """Test the JSON and curl epoch/SWET endpoints reject non-numbers, inf and nan"""
+        response = client.get(f'/api/v1/{kind}/{value}')
+        assert response.status_code == 400
+        assert response.get_json() == {'message': message}
+        
+        response = client.get(f'/curl/v1/{kind}/{value}')
+        assert response.status_code == 400
+        assert response.get_data(as_text=True).startswith(f'Error: {message}')
+    
+    @pytest.mark.parametrize("value", VALID_NUMBER_INPUTS)
+    @pytest.mark.parametrize("direction", ['epoch_to_human', 'epoch_to_swet',
+                                           'swet_to_human', 'swet_to_epoch'])
+    def test_form_number_formats_accepted(self, client, direction, value):
+        """Test the index form converts any finite number format"""
+        response = client.post('/', data={'direction': direction, 'input_value': value})
+        assert response.status_code == 200
+        assert 'Error:' not in response.get_data(as_text=True)
+    
+    @pytest.mark.parametrize("value", INVALID_NUMBER_INPUTS)
+    @pytest.mark.parametrize("direction,message", [('epoch_to_human', 'Invalid epoch time format'),
+                                                   ('epoch_to_swet', 'Invalid epoch time format'),
+                                                   ('swet_to_human', 'Invalid SWET time format'),
+                                                   ('swet_to_epoch', 'Invalid SWET time format')])
+    def test_form_number_formats_rejected(self, client, direction, message, value):
+        """Test the index form reports non-numbers, inf and nan as format errors"""
+        response = client.post('/', data={'direction': direction, 'input_value': value})
+        assert response.status_code == 200
+        assert f'Error: {message}' in response.get_data(as_text=True)
+    
+    def test_api_v1_epoch_fractional(self, client):
+        """Test /api/v1/epoch/{epoch_time} rounds fractions like datetime.fromtimestamp"""
+        response = client.get('/api/v1/epoch/0.9999999')
+        assert response.status_code == 200
+        assert response.get_json()['datetime'] == "Thu 1970-01-01 00:00:01 UTC"
+    
+    def test_api_v1_epoch_out_of_range(self, client):
+        """Test /api/v1/epoch/{epoch_time} with an epoch past any representable date"""
+        response = client.get('/api/v1/epoch/1e20')
+        assert response.status_code == 400
+        assert 'message' in response.get_json()
+    
     def test_curl_v1_epoch_to_datetime(self, client):
         """Test /curl/v1/epoch/{epoch_time} endpoint"""
         response = client.get('/curl/v1/epoch/1757509860')
         assert response.status_code == 200
         
-        text = response.data.decode('utf-8')
-        assert 'Epoch:     1757509860' in text
-        assert 'Datetime:  Wed 2025-09-10 13:11:00 UTC' in text
-        assert 'Input:     1757509860' in text
+        text = response.get_data(as_text=True)
+        assert_all_in(text, ('Epoch:     1757509860',
+                             'Datetime:  Wed 2025-09-10 13:11:00 UTC',
+                             'Input:     1757509860'))
     
-    def test_curl_v1_datetime_to_epoch_formats(self, client):
+    @pytest.mark.parametrize("dt_str,expected", URL_DATETIME_FORMAT_CASES)
+    def test_curl_v1_datetime_to_epoch_formats(self, client, dt_str, expected):
         """Test /curl/v1/datetime/{datetime_str} endpoint with various formats"""
-        # Test YYYY-MM-DD-HHMMSS format
-        response = client.get('/curl/v1/datetime/2025-09-10-131100')
-        assert response.status_code == 200
-        
-        text = response.data.decode('utf-8')
-        assert 'Epoch:     1757509860' in text
-        assert 'Datetime:  2025-09-10-131100' in text
-        
-        # Test YYYYMMDDHHMMSS format
-        response = client.get('/curl/v1/datetime/20250910131100')
+        response = client.get(f'/curl/v1/datetime/{dt_str}')
         assert response.status_code == 200
         
-        text = response.data.decode('utf-8')
-        assert 'Epoch:     1757509860' in text
+        text = response.get_data(as_text=True)
+        assert f'Epoch:     {expected}' in text
+        assert f'Datetime:  {dt_str}' in text
     
     def test_curl_v1_invalid_datetime(self, client):
         """Test /curl/v1/datetime/{datetime_str} endpoint with invalid input"""
         response = client.get('/curl/v1/datetime/invalid-date')
         assert response.status_code == 400
         
-        text = response.data.decode('utf-8')
+        text = response.get_data(as_text=True)
         assert 'Error: Invalid datetime format' in text
     
     def test_health_endpoint(self, client):
@@ -258,105 +364,174 @@ class TestAPIEndpoints:
         response = client.get('/health')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        assert response.content_type == 'application/json'
+        data = response.get_json()
         assert data['status'] == 'healthy'
         assert 'timestamp' in data
     
+    def test_health_timestamp_format(self, client):
+        """Test /health reports the current time as whole-second ISO 8601 UTC"""
+        before = int(time.time())
+        timestamp = client.get('/health').get_json()['timestamp']
+        after = int(time.time())
+        assert HEALTH_TIMESTAMP_RE.match(timestamp)
+        reported = datetime.fromisoformat(timestamp).timestamp()
+        assert before <= reported <= after
+    
+    @pytest.mark.parametrize("epoch,expected", [
+        (-62135596800, 'Mon 0001-01-01 00:00:00 UTC'),  # EPOCH_MIN
+        (253402300799, 'Fri 9999-12-31 23:59:59 UTC'),  # EPOCH_MAX
+    ])
+    def test_epoch_page_range_limits(self, client, epoch, expected):
+        """Test /epoch/{epoch_time} renders the first and last representable seconds"""
+        response = client.get(f'/epoch/{epoch}')
+        assert response.status_code == 200
+        assert expected in response.get_data(as_text=True)
+    
+    @pytest.mark.parametrize("epoch", [-62135596801, 253402300800])
+    def test_epoch_page_out_of_range(self, client, epoch):
+        """Test /epoch/{epoch_time} reports epochs one second past either limit"""
+        response = client.get(f'/epoch/{epoch}')
+        assert response.status_code == 400
+        assert 'Error: Epoch time out of range' in response.get_data(as_text=True)
+    
     def test_root_endpoint(self, client):
         """Test root endpoint returns HTML"""
         response = client.get('/')
         assert response.status_code == 200
         assert 'text/html' in response.content_type
     
+    def test_root_get_is_cacheable(self, client):
+        """Test the blank form is served as a prebuilt page with validators"""
+        response = client.get('/')
+        assert response.cache_control.max_age == 60
+        etag = response.headers['ETag']
+        assert etag
+        assert client.get('/', headers={'If-None-Match': etag}).status_code == 304
+    
+    @pytest.mark.parametrize("direction,expected", [('epoch_to_human', 'Epoch: 1000\n'),
+                                                    ('swet_to_human', 'SWET: 1000\n')])
+    def test_root_post_underscore_grouping(self, client, direction, expected):
+        """Test the form converts underscore-grouped numbers as float() does"""
+        response = client.post('/', data={'direction': direction, 'input_value': '1_000'})
+        assert expected in response.get_data(as_text=True)
+    
+    def test_root_post_renders_result(self, client):
+        """Test submitting the form still renders a fresh result page"""
+        response = client.post('/', data={'direction': 'epoch_to_human',
+                                          'input_value': '1757509860'})
+        assert response.status_code == 200
+        assert 'ETag' not in response.headers
+        text = response.get_data(as_text=True)
+        assert 'Wed 2025-09-10 13:11:00 UTC' in text
+        assert 'Error:' not in text
+    
     def test_api_v1_swet_to_datetime(self, client):
         """Test /api/v1/swet/{swet_time} endpoint"""
-        # Use known SWET timestamp
-        swet_timestamp = 1524057060  # Converts to Unix 1757509860
-        response = client.get(f'/api/v1/swet/{swet_timestamp}')
+        response = client.get(f'/api/v1/swet/{SWET_TIMESTAMP}')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
-        assert data['swet'] == swet_timestamp
+        data = response.get_json()
+        assert data['swet'] == SWET_TIMESTAMP
         assert data['unix'] == 1757509860
         assert data['datetime'] == "Wed 2025-09-10 13:11:00 UTC"
-        assert data['input'] == str(swet_timestamp)
+        assert data['input'] == '1524057060'
     
     def test_api_v1_datetime_to_swet(self, client):
         """Test /api/v1/datetime-to-swet/{datetime_str} endpoint"""
         response = client.get('/api/v1/datetime-to-swet/2025-09-10-131100')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['swet'] == 1524057060
         assert data['unix'] == 1757509860
         assert data['input'] == '2025-09-10-131100'
         assert data['datetime'] == '2025-09-10-131100'
     
-    def test_api_v1_swet_info(self, client):
+    def test_api_v1_swet_info(self, client, swet_info):
         """Test /api/v1/swet-info endpoint"""
         response = client.get('/api/v1/swet-info')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
-        required_keys = ['current_swet', 'years_since_release', 'swet_epoch_start', 'description']
-        for key in required_keys:
-            assert key in data
+        data = response.get_json()
+        assert data.keys() == swet_info.keys()
+        # The clock may have moved on since the fixture ran; everything else is fixed
+        assert data['current_swet'] == pytest.approx(swet_info['current_swet'], abs=60)
+        assert data['years_since_release'] == pytest.approx(swet_info['years_since_release'], abs=0.1)
+        assert data['swet_epoch_start'] == swet_info['swet_epoch_start']
+        assert data['description'] == swet_info['description']
     
     def test_curl_v1_swet_to_datetime(self, client):
         """Test /curl/v1/swet/{swet_time} endpoint"""
-        swet_timestamp = 1524057060
-        response = client.get(f'/curl/v1/swet/{swet_timestamp}')
+        response = client.get(f'/curl/v1/swet/{SWET_TIMESTAMP}')
         assert response.status_code == 200
         
-        text = response.data.decode('utf-8')
-        assert f'SWET:      {swet_timestamp}' in text
-        assert 'Unix:      1757509860' in text
-        assert 'Datetime:  Wed 2025-09-10 13:11:00 UTC' in text
-        assert f'Input:     {swet_timestamp}' in text
+        text = response.get_data(as_text=True)
+        assert_all_in(text, ('SWET:      1524057060',
+                             'Unix:      1757509860',
+                             'Datetime:  Wed 2025-09-10 13:11:00 UTC',
+                             'Input:     1524057060'))
     
     def test_curl_v1_datetime_to_swet(self, client):
         """Test /curl/v1/datetime-to-swet/{datetime_str} endpoint"""
         response = client.get('/curl/v1/datetime-to-swet/2025-09-10-131100')
         assert response.status_code == 200
         
-        text = response.data.decode('utf-8')
-        assert 'SWET:      1524057060' in text
-        assert 'Unix:      1757509860' in text
-        assert 'Datetime:  2025-09-10-131100' in text
-        assert 'Input:     2025-09-10-131100' in text
+        text = response.get_data(as_text=True)
+        assert_all_in(text, ('SWET:      1524057060',
+                             'Unix:      1757509860',
+                             'Datetime:  2025-09-10-131100',
+                             'Input:     2025-09-10-131100'))
     
     def test_curl_v1_swet_info(self, client):
         """Test /curl/v1/swet-info endpoint"""
         response = client.get('/curl/v1/swet-info')
         assert response.status_code == 200
         
-        text = response.data.decode('utf-8')
-        assert 'SWET (Star Wars Epoch Time) Information:' in text
-        assert 'Current SWET:' in text
-        assert 'Years Since Release:' in text
-        assert 'SWET Epoch Start:    1977-05-26 00:00:00 UTC' in text
-        assert 'Star Wars' in text
+        text = response.get_data(as_text=True)
+        assert_all_in(text, ('SWET (Star Wars Epoch Time) Information:',
+                             'Current SWET:',
+                             'Years Since Release:',
+                             'SWET Epoch Start:    1977-05-26 00:00:00 UTC',
+                             'Star Wars'))
 
 
 class TestSwaggerDocumentation:
     """Test Swagger documentation endpoints"""
     
-    @pytest.fixture
-    def client(self):
-        """Create a test client for the Flask app"""
-        app.config['TESTING'] = True
-        with app.test_client() as client:
-            yield client
-    
-    def test_api_swagger_json(self, client):
-        """Test /api/swagger.json endpoint"""
+    @pytest.fixture(scope="class")
+    def swagger_spec(self, client):
+        """Fetch and parse /api/swagger.json once for the whole class"""
         response = client.get('/api/swagger.json')
         assert response.status_code == 200
-        
-        data = json.loads(response.data)
-        assert 'swagger' in data
-        assert 'info' in data
-        assert data['info']['title'] == 'TimePuff Epoch Converter API'
+        return response.get_json()
+    
+    def test_api_swagger_json(self, swagger_spec):
+        """Test /api/swagger.json endpoint"""
+        assert 'swagger' in swagger_spec
+        assert 'info' in swagger_spec
+        assert swagger_spec['info']['title'] == 'TimePuff Epoch Converter API'
+    
+    def test_api_swagger_json_paths(self, swagger_spec):
+        """Test /api/swagger.json documents every v1 endpoint"""
+        assert swagger_spec['basePath'] == '/api'
+        assert set(swagger_spec['paths']) == {
+            '/v1/epoch/{epoch_time}',
+            '/v1/swet/{swet_time}',
+            '/v1/datetime-to-swet/{datetime_str}',
+            '/v1/swet-info',
+            '/v1/datetime/{datetime_str}',
+        }
+        epoch_op = swagger_spec['paths']['/v1/epoch/{epoch_time}']['get']
+        assert epoch_op['operationId'] == 'epoch_to_datetime'
+        assert epoch_op['responses']['400']['schema'] == {'$ref': '#/definitions/ErrorResponse'}
+    
+    def test_api_swagger_json_definitions(self, swagger_spec):
+        """Test /api/swagger.json defines the response models it references"""
+        definitions = swagger_spec['definitions']
+        assert set(definitions) == {'EpochResponse', 'DateTimeResponse', 'ErrorResponse'}
+        assert set(definitions['EpochResponse']['properties']) == {'epoch', 'datetime', 'input'}
+        assert set(definitions['ErrorResponse']['properties']) == {'message'}
     
     def test_api_docs_endpoint(self, client):
         """Test /api/docs/ endpoint"""
@@ -365,5 +540,83 @@ class TestSwaggerDocumentation:
         assert 'text/html' in response.content_type
 
 
+class TestPayloadCaching:
+    """Test conditional GET support on the prebuilt docs payloads"""
+    
+    @pytest.mark.parametrize("url", ['/api/docs/', '/api/redoc/', '/api/swagger.json', '/api/v1/swagger.json'])
+    def test_etag_and_last_modified(self, client, url):
+        """Test docs payloads carry validators and a max-age"""
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers['ETag']
+        assert response.headers['Last-Modified']
+        assert response.cache_control.max_age == 3600
+    
+    def test_if_none_match_returns_304(self, client):
+        """Test a request with the current ETag gets an empty 304"""
+        etag = client.get('/api/docs/').headers['ETag']
+        response = client.get('/api/docs/', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+    
+    def test_stale_etag_returns_body(self, client):
+        """Test a request with an old ETag gets the full payload"""
+        response = client.get('/api/docs/', headers={'If-None-Match': '"stale"'})
+        assert response.status_code == 200
+        assert response.data
+    
+    def test_gzip_variant(self, client):
+        """Test gzip-accepting clients get a compressed copy of the identity payload"""
+        identity = client.get('/api/docs/')
+        compressed = client.get('/api/docs/', headers={'Accept-Encoding': 'gzip'})
+        assert compressed.status_code == 200
+        assert compressed.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(compressed.data) == identity.data
+        assert len(compressed.data) < len(identity.data)
+        # Each representation has its own validator
+        assert compressed.headers['ETag'] != identity.headers['ETag']
+        assert compressed.headers['ETag'].endswith('-gzip"')
+    
+    def test_gzip_variant_304(self, client):
+        """Test the gzip variant's ETag revalidates to a 304"""
+        headers = {'Accept-Encoding': 'gzip'}
+        etag = client.get('/api/docs/', headers=headers).headers['ETag']
+        response = client.get('/api/docs/', headers={**headers, 'If-None-Match': etag})
+        assert response.status_code == 304
+    
+    @pytest.mark.parametrize("accept_encoding", ['gzip', 'identity'])
+    def test_vary_accept_encoding(self, client, accept_encoding):
+        """Test both representations tell caches they vary on Accept-Encoding"""
+        response = client.get('/api/docs/', headers={'Accept-Encoding': accept_encoding})
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert 'Content-Encoding' not in response.headers or accept_encoding == 'gzip'
+
+
+class TestStaticAssets:
+    """Test fingerprinted static asset URLs and their caching"""
+    
+    def test_static_links_are_versioned(self, client):
+        """Test pages link static files with their current content hash"""
+        version = timepuff_app._static_version('main.css')
+        assert f'/static/main.css?v={version}' in client.get('/').get_data(as_text=True)
+    
+    def test_matching_version_is_immutable(self, client):
+        """Test a ?v= matching the file's content hash is cached for a year"""
+        version = timepuff_app._static_version('main.css')
+        response = client.get(f'/static/main.css?v={version}')
+        assert response.status_code == 200
+        assert response.cache_control.immutable
+        assert response.cache_control.public
+        assert response.cache_control.max_age == timepuff_app.STATIC_VERSIONED_MAX_AGE
+    
+    @pytest.mark.parametrize("query", ['?v=anything', ''])
+    def test_other_versions_are_revalidated(self, client, query):
+        """Test a stale, made-up or missing ?v= gets no long-lived cache headers"""
+        response = client.get(f'/static/main.css{query}')
+        assert response.status_code == 200
+        assert not response.cache_control.immutable
+        assert response.cache_control.max_age != timepuff_app.STATIC_VERSIONED_MAX_AGE
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])